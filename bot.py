@@ -19,10 +19,16 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import heapq
 import logging
+import random
 import signal
+import threading
 import time
 import traceback
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 
 import config
 from polymarket_client import fetch_active_events
@@ -33,33 +39,58 @@ from telegram_alerts import (
     send_error_message,
     _passes_quality_filter,
     _rank_score,
-    daily_slots_remaining,
-    daily_cap_reached,
-    _reset_daily_counter_if_needed,
+    get_daily_state,
+    wait_for_sends,
 )
 
 # ── Logging setup ────────────────────────────────────────────────────────────
 
 logging.basicConfig(
-    level=getattr(logging, config.LOG_LEVEL.upper(), logging.INFO),
+    level=config.LOG_LEVEL_INT,
     format="%(asctime)s  %(levelname)-8s  %(name)s  %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 logger = logging.getLogger("polymarket_bot")
 
+# ── Startup banner (config is fixed at import, so format it once) ───────────
+
+_CAP_DISPLAY = (
+    f"{config.MAX_ALERTS_PER_DAY}/day"
+    if config.MAX_ALERTS_PER_DAY > 0
+    else "unlimited"
+)
+
+_STARTUP_BANNER: tuple[str, ...] = (
+    "=" * 60,
+    "  Polymarket Alert Bot starting",
+    "=" * 60,
+    f"  Poll interval   : {config.POLL_INTERVAL_SECONDS}s",
+    f"  Odds shift      : {config.ODDS_SHIFT_THRESHOLD * 100:.0f}%",
+    f"  Volume spike    : {config.VOLUME_SPIKE_MULTIPLIER:.1f}x",
+    f"  Closing soon    : {config.CLOSING_SOON_HOURS}h",
+    f"  New markets     : {config.NEW_MARKET_HOURS}h",
+    f"  Mispricing      : {config.MISPRICE_SUM_DEVIATION * 100:.0f}%",
+    f"  Topic filter    : {config.TOPIC_KEYWORDS or '(all)'}",
+    f"  Min confidence  : {config.MIN_CONFIDENCE}",
+    f"  Allowed actions : {config.ALLOWED_ACTIONS}",
+    f"  Daily alert cap : {_CAP_DISPLAY}",
+    f"  Telegram        : "
+    f"{'configured' if config.TELEGRAM_BOT_TOKEN else 'NOT configured (console mode)'}",
+    "=" * 60,
+)
+
+# Innermost stack frames kept when formatting a failed scan's traceback.
+_TRACEBACK_FRAMES = 8
+
 # ── Graceful shutdown ────────────────────────────────────────────────────────
 
-_running = True
+# Set by the signal handler; sleeps wait on it so shutdown is immediate.
+_stop_event = threading.Event()
 
 
 def _shutdown_handler(signum, frame):
-    global _running
     logger.info("Received signal %s — shutting down gracefully.", signum)
-    _running = False
-
-
-signal.signal(signal.SIGINT, _shutdown_handler)
-signal.signal(signal.SIGTERM, _shutdown_handler)
+    _stop_event.set()
 
 
 # ── Core scan cycle ──────────────────────────────────────────────────────────
@@ -68,13 +99,13 @@ def scan_once(dry_run: bool = False) -> int:
     """
     Execute a single scan cycle.
 
-    Returns the number of alerts sent (or that would be sent, if dry_run).
+    Returns the number of alerts queued for sending (or that would be sent,
+    if dry_run).
     """
-    _reset_daily_counter_if_needed()
+    cap_reached, slots = get_daily_state()
 
     # Skip fetching entirely if the daily cap is already reached (saves API calls)
-    if not dry_run and daily_cap_reached():
-        slots = daily_slots_remaining()
+    if not dry_run and cap_reached:
         logger.info(
             "Daily cap of %d reached (%d slots remaining) — skipping scan.",
             config.MAX_ALERTS_PER_DAY, slots,
@@ -83,25 +114,34 @@ def scan_once(dry_run: bool = False) -> int:
 
     logger.info("Starting scan cycle...")
 
-    # 1. Fetch data
-    events = fetch_active_events()
+    # 1. Fetch data (pages are requested concurrently, under a deadline)
+    try:
+        events = asyncio.run(
+            asyncio.wait_for(fetch_active_events(), timeout=config.SCAN_FETCH_DEADLINE)
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Fetching events exceeded the %.0fs deadline — skipping this cycle.",
+            config.SCAN_FETCH_DEADLINE,
+        )
+        return 0
     if not events:
         logger.warning("No events returned — skipping this cycle.")
         return 0
 
-    total_markets = sum(len(e.get("markets", [])) for e in events)
-    logger.info("Scanning %d events containing %d markets.", len(events), total_markets)
-
     # 2. Detect opportunities
-    alerts = run_all_detectors(events)
+    alerts, total_markets = run_all_detectors(events)
+    logger.info("Scanned %d events containing %d markets.", len(events), total_markets)
     if not alerts:
         logger.info("No opportunities detected this cycle.")
         return 0
 
     # 3. Quality filter + ranking (for logging / dry-run reporting)
-    qualified = [a for a in alerts if _passes_quality_filter(a)]
-    ranked    = sorted(qualified, key=_rank_score, reverse=True)
-    slots     = daily_slots_remaining()
+    # Filter and score in one pass (each alert is scored exactly once), then
+    # select only the top `cap` in O(N log cap).
+    qualified = [(_rank_score(a), a) for a in alerts if _passes_quality_filter(a)]
+    cap       = slots if config.MAX_ALERTS_PER_DAY > 0 else len(qualified)
+    ranked    = heapq.nlargest(cap, qualified, key=itemgetter(0))
 
     logger.info(
         "Quality filter: %d raw → %d HIGH+BUY → top %d eligible | %d daily slot(s) left.",
@@ -110,19 +150,20 @@ def scan_once(dry_run: bool = False) -> int:
 
     if dry_run:
         # Show the top N that would be sent (capped by daily limit)
-        cap     = slots if config.MAX_ALERTS_PER_DAY > 0 else len(ranked)
-        to_show = ranked[:cap]
-        logger.info("[DRY RUN] Would send %d alert(s) this cycle:", len(to_show))
-        for i, a in enumerate(to_show, 1):
-            logger.info(
-                "  %d. [%s] %s | %s | score=%.1f",
-                i, a.signal_type, a.action, a.market_question[:55], _rank_score(a),
-            )
+        to_show = ranked
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[DRY RUN] Would send %d alert(s) this cycle:", len(to_show))
+            for i, (score, a) in enumerate(to_show, 1):
+                logger.info(
+                    "  %d. [%s] %s | %s | score=%.1f",
+                    i, a.signal_type, a.action, a.market_question[:55], score,
+                )
         return len(to_show)
 
-    # 4. Send (telegram_alerts handles ranking, cap, and cooldown internally)
+    # 4. Send (telegram_alerts handles ranking, cap, and cooldown internally,
+    #    and delivers on its own sender thread)
     sent = send_alerts(alerts)
-    logger.info("Sent %d alert(s) to Telegram this cycle.", sent)
+    logger.info("Queued %d alert(s) for Telegram this cycle.", sent)
     return sent
 
 
@@ -136,28 +177,14 @@ def main() -> None:
                         help="Detect opportunities but don't send Telegram messages.")
     args = parser.parse_args()
 
-    cap_display = (
-        f"{config.MAX_ALERTS_PER_DAY}/day"
-        if config.MAX_ALERTS_PER_DAY > 0
-        else "unlimited"
-    )
+    # Registered here rather than at import so programmatic scan_once() callers
+    # keep their own signal handling.
+    signal.signal(signal.SIGINT, _shutdown_handler)
+    signal.signal(signal.SIGTERM, _shutdown_handler)
 
-    logger.info("=" * 60)
-    logger.info("  Polymarket Alert Bot starting")
-    logger.info("=" * 60)
-    logger.info("  Poll interval   : %ds",   config.POLL_INTERVAL_SECONDS)
-    logger.info("  Odds shift      : %.0f%%", config.ODDS_SHIFT_THRESHOLD * 100)
-    logger.info("  Volume spike    : %.1fx",  config.VOLUME_SPIKE_MULTIPLIER)
-    logger.info("  Closing soon    : %dh",    config.CLOSING_SOON_HOURS)
-    logger.info("  New markets     : %dh",    config.NEW_MARKET_HOURS)
-    logger.info("  Mispricing      : %.0f%%", config.MISPRICE_SUM_DEVIATION * 100)
-    logger.info("  Topic filter    : %s",     config.TOPIC_KEYWORDS or "(all)")
-    logger.info("  Min confidence  : %s",     config.MIN_CONFIDENCE)
-    logger.info("  Allowed actions : %s",     config.ALLOWED_ACTIONS)
-    logger.info("  Daily alert cap : %s",     cap_display)
-    logger.info("  Telegram        : %s",
-                "configured" if config.TELEGRAM_BOT_TOKEN else "NOT configured (console mode)")
-    logger.info("=" * 60)
+    if logger.isEnabledFor(logging.INFO):
+        for line in _STARTUP_BANNER:
+            logger.info(line)
 
     if not args.dry_run:
         send_startup_message()
@@ -168,16 +195,34 @@ def main() -> None:
 
     # Continuous loop
     consecutive_errors = 0
-    while _running:
+    last_error_notify: float | None = None
+    idle_interval = config.POLL_INTERVAL_SECONDS
+    max_idle_interval = config.POLL_INTERVAL_SECONDS * max(1, config.IDLE_BACKOFF_MAX_MULTIPLIER)
+    while not _stop_event.is_set():
         try:
-            scan_once(dry_run=args.dry_run)
+            sent = scan_once(dry_run=args.dry_run)
+            if not args.dry_run:
+                # The cap check and idle backoff below go by confirmed
+                # deliveries: failed sends hand their daily slots back.
+                sent = wait_for_sends()
             consecutive_errors = 0
-        except Exception:
+        except Exception as exc:
             consecutive_errors += 1
-            tb = traceback.format_exc()
+            # Format only the innermost frames: deep requests/urllib3 stacks
+            # would otherwise build tens of KB of text on every failure.
+            tb = "".join(
+                traceback.TracebackException.from_exception(exc, limit=-_TRACEBACK_FRAMES).format()
+            )
             logger.error("Scan cycle failed (attempt %d):\n%s", consecutive_errors, tb)
 
-            if consecutive_errors == 1:
+            # Notify on the first failure of a streak, but at most once per
+            # ALERT_COOLDOWN_SECONDS so a flapping API can't spam Telegram.
+            now = time.monotonic()
+            if consecutive_errors == 1 and (
+                last_error_notify is None
+                or now - last_error_notify >= config.ALERT_COOLDOWN_SECONDS
+            ):
+                last_error_notify = now
                 try:
                     send_error_message(tb[-500:])
                 except Exception:
@@ -188,15 +233,34 @@ def main() -> None:
             _interruptible_sleep(backoff)
             continue
 
-        _interruptible_sleep(config.POLL_INTERVAL_SECONDS)
+        # Nothing more can be sent today — sleep straight through to the reset
+        # instead of waking every poll interval just to skip the scan.
+        cap_reached, _ = get_daily_state()
+        if cap_reached and not args.dry_run:
+            wait = _seconds_until_utc_midnight()
+            logger.info("Daily cap reached — sleeping %.0fs until UTC midnight.", wait)
+            _interruptible_sleep(wait)
+            idle_interval = config.POLL_INTERVAL_SECONDS
+            continue
+
+        # Back off geometrically while the market is quiet; reset on activity.
+        if sent > 0:
+            idle_interval = config.POLL_INTERVAL_SECONDS
+        _interruptible_sleep(idle_interval * random.uniform(0.9, 1.1))
+        if sent == 0:
+            idle_interval = min(idle_interval * 2, max_idle_interval)
 
     logger.info("Bot stopped.")
 
 
+def _seconds_until_utc_midnight() -> float:
+    now = datetime.now(timezone.utc)
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (midnight - now).total_seconds() + 1   # land just after the reset
+
+
 def _interruptible_sleep(seconds: float) -> None:
-    end = time.time() + seconds
-    while _running and time.time() < end:
-        time.sleep(min(1, end - time.time()))
+    _stop_event.wait(seconds)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,10 @@ python-dotenv).  Sensible defaults are provided so the bot works out of the
 box for testing; tweak the thresholds to match your risk appetite.
 """
 
+import logging
 import os
+import sys
+
 from dotenv import load_dotenv
 
 # ── Load .env file if present ────────────────────────────────────────────────
@@ -24,6 +27,14 @@ DATA_API_BASE: str = "https://data-api.polymarket.com"
 # ── Polling Interval ─────────────────────────────────────────────────────────
 # How often (in seconds) the bot fetches fresh market data.
 POLL_INTERVAL_SECONDS: int = int(os.getenv("POLL_INTERVAL_SECONDS", "45"))
+# Deadline (seconds) for fetching a cycle's data; a slower Gamma API skips the
+# cycle instead of pushing the loop past its cadence.
+SCAN_FETCH_DEADLINE: float = float(
+    os.getenv("SCAN_FETCH_DEADLINE", str(max(5, POLL_INTERVAL_SECONDS - 5)))
+)
+# When a cycle sends nothing, the interval doubles (±10% jitter) up to this
+# many times POLL_INTERVAL_SECONDS, and snaps back as soon as alerts resume.
+IDLE_BACKOFF_MAX_MULTIPLIER: int = int(os.getenv("IDLE_BACKOFF_MAX_MULTIPLIER", "8"))
 
 # ── Pagination ───────────────────────────────────────────────────────────────
 # Maximum number of events to fetch per polling cycle (across all pages).
@@ -73,12 +84,20 @@ MISPRICE_MIN_LIQUIDITY: float = float(os.getenv("MISPRICE_MIN_LIQUIDITY", "5000"
 #   Set to "MEDIUM" to also receive medium-confidence alerts.
 #   Set to "LOW" to receive everything (not recommended — very noisy).
 MIN_CONFIDENCE: str = os.getenv("MIN_CONFIDENCE", "HIGH")
+# Integer tier (LOW=0, MEDIUM=1, HIGH=2) so the filter compares ints, not strings.
+MIN_CONFIDENCE_RANK: int = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}.get(MIN_CONFIDENCE.upper(), 2)
 
 # ALLOWED_ACTIONS: comma-separated list of actions to send.
 #   Options: "BUY YES", "BUY NO", "WATCH", "SKIP"
 #   Default: "BUY YES,BUY NO" — only actionable buy signals, no WATCH/SKIP.
 #   Set to "BUY YES,BUY NO,WATCH" to also receive watch alerts.
 ALLOWED_ACTIONS: str = os.getenv("ALLOWED_ACTIONS", "BUY YES,BUY NO")
+# Parsed once at import: uppercased, whitespace-stripped, and interned like
+# the detectors' Action constants.  Membership still hashes and compares for
+# equality; interning only lets that compare short-circuit on identity.
+ALLOWED_ACTIONS_SET: frozenset[str] = frozenset(
+    sys.intern(a.strip().upper()) for a in ALLOWED_ACTIONS.split(",")
+)
 
 # ── Daily Alert Cap ─────────────────────────────────────────────────────────
 # Maximum number of alerts to send per calendar day (UTC midnight resets).
@@ -91,15 +110,105 @@ MAX_ALERTS_PER_DAY: int = int(os.getenv("MAX_ALERTS_PER_DAY", "5"))
 # Minimum seconds between repeated alerts for the *same* market + signal type.
 ALERT_COOLDOWN_SECONDS: int = int(os.getenv("ALERT_COOLDOWN_SECONDS", "3600"))
 
+# Optional JSON file persisting the daily counter and cooldowns, so a redeploy
+# or crash mid-day neither resets the daily cap nor re-sends recent alerts.
+# Empty disables it.
+ALERT_STATE_FILE: str = os.getenv("ALERT_STATE_FILE", "")
+
+# Pack the alerts of one scan cycle into as few Telegram messages as fit
+# (4096-char limit) instead of one message per alert.  Saves per-chat rate
+# limit when many alerts go out at once.  Default: off.
+COALESCE_ALERTS: bool = os.getenv("COALESCE_ALERTS", "false").strip().lower() in ("1", "true", "yes")
+# A cycle sending more than this many alerts (e.g. after a market-wide move)
+# goes out as a compact digest — one short row per alert, no explanations —
+# instead of full messages.  0 disables (default).
+DIGEST_THRESHOLD: int = int(os.getenv("DIGEST_THRESHOLD", "0"))
+
 # ── Topic Filters (optional) ────────────────────────────────────────────────
 # Comma-separated list of keywords.  If set, only markets whose question or
 # description contains at least one keyword will be monitored.
 # Example: "bitcoin,trump,election,fed,ai"
 TOPIC_KEYWORDS: str = os.getenv("TOPIC_KEYWORDS", "")
+# Parsed once at import: lowercased, whitespace-stripped, empties dropped.
+TOPIC_KEYWORDS_SET: frozenset[str] = frozenset(
+    k.strip().lower() for k in TOPIC_KEYWORDS.split(",") if k.strip()
+)
 
 # ── Logging ──────────────────────────────────────────────────────────────────
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVEL_INT: int = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
 
 # ── HTTP Settings ────────────────────────────────────────────────────────────
 REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
 MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+# Keep-alive connections kept per host by the shared HTTP session.  Should be
+# at least MAX_EVENTS_PER_CYCLE / PAGE_SIZE so concurrent page fetches never
+# have to open throwaway connections.
+HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "8"))
+# Optional file persisting Gamma page ETags (with their bodies) across process
+# restarts, so one-shot runs such as send_top_alerts.py revalidate instead of
+# re-downloading every page.  Empty disables it.
+HTTP_CACHE_FILE: str = os.getenv("HTTP_CACHE_FILE", "")
+# Client-side request rate per API host (requests/second).  Starts at
+# RATE_LIMIT_RPS, creeps up towards RATE_LIMIT_MAX_RPS while requests succeed
+# and halves whenever the server throttles (429/503).
+RATE_LIMIT_RPS: float = float(os.getenv("RATE_LIMIT_RPS", "10"))
+RATE_LIMIT_MAX_RPS: float = float(os.getenv("RATE_LIMIT_MAX_RPS", "50"))
+
+
+# ── Validation ───────────────────────────────────────────────────────────────
+# Everything above is parsed exactly once, here at import.  Reject nonsense
+# values now rather than letting them silently disable a detector later.
+
+def _validate() -> None:
+    probabilities = {
+        "ODDS_SHIFT_THRESHOLD":   ODDS_SHIFT_THRESHOLD,
+        "CLOSING_EDGE_MIN":       CLOSING_EDGE_MIN,
+        "CLOSING_EDGE_MAX":       CLOSING_EDGE_MAX,
+        "MISPRICE_SUM_DEVIATION": MISPRICE_SUM_DEVIATION,
+    }
+    for name, value in probabilities.items():
+        if not 0.0 <= value <= 1.0:
+            raise ValueError(f"{name} must be between 0 and 1, got {value!r}")
+    if CLOSING_EDGE_MIN > CLOSING_EDGE_MAX:
+        raise ValueError(
+            f"CLOSING_EDGE_MIN ({CLOSING_EDGE_MIN}) exceeds CLOSING_EDGE_MAX ({CLOSING_EDGE_MAX})"
+        )
+
+    positive = {
+        "POLL_INTERVAL_SECONDS":   POLL_INTERVAL_SECONDS,
+        "MAX_EVENTS_PER_CYCLE":    MAX_EVENTS_PER_CYCLE,
+        "VOLUME_SPIKE_MULTIPLIER": VOLUME_SPIKE_MULTIPLIER,
+        "REQUEST_TIMEOUT":         REQUEST_TIMEOUT,
+        "HTTP_POOL_SIZE":          HTTP_POOL_SIZE,
+        "SCAN_FETCH_DEADLINE":     SCAN_FETCH_DEADLINE,
+        "RATE_LIMIT_RPS":          RATE_LIMIT_RPS,
+    }
+    for name, value in positive.items():
+        if value <= 0:
+            raise ValueError(f"{name} must be positive, got {value!r}")
+
+    if RATE_LIMIT_MAX_RPS < RATE_LIMIT_RPS:
+        raise ValueError(
+            f"RATE_LIMIT_MAX_RPS ({RATE_LIMIT_MAX_RPS}) is below RATE_LIMIT_RPS ({RATE_LIMIT_RPS})"
+        )
+
+    non_negative = {
+        "MIN_VOLUME_24H":           MIN_VOLUME_24H,
+        "CLOSING_SOON_HOURS":       CLOSING_SOON_HOURS,
+        "NEW_MARKET_HOURS":         NEW_MARKET_HOURS,
+        "NEW_MARKET_MIN_LIQUIDITY": NEW_MARKET_MIN_LIQUIDITY,
+        "MISPRICE_MIN_LIQUIDITY":   MISPRICE_MIN_LIQUIDITY,
+        "ALERT_COOLDOWN_SECONDS":   ALERT_COOLDOWN_SECONDS,
+        "MAX_RETRIES":              MAX_RETRIES,
+        "DIGEST_THRESHOLD":         DIGEST_THRESHOLD,
+    }
+    for name, value in non_negative.items():
+        if value < 0:
+            raise ValueError(f"{name} must not be negative, got {value!r}")
+
+    if MIN_CONFIDENCE.upper() not in ("HIGH", "MEDIUM", "LOW"):
+        raise ValueError(f"MIN_CONFIDENCE must be HIGH, MEDIUM or LOW, got {MIN_CONFIDENCE!r}")
+
+
+_validate()
@@ -8,8 +8,16 @@ objects.  Every alert now includes a structured recommendation:
   - confidence:  HIGH | MEDIUM | LOW
   - bet_size:    LARGE ($50-100) | MEDIUM ($20-50) | SMALL ($5-10) | NONE
   - explanation: 1-2 plain-English sentences describing the opportunity
+                 (formatted lazily, the first time it is read)
   - risk_note:   optional caution (e.g. low liquidity, near expiry, etc.)
 
+The per-market detectors take an optional pre-parsed ``yes_price`` (and the
+time-based ones an optional epoch ``now_ts``) so that ``run_all_detectors`` can parse
+each market's ``outcomePrices`` and read the clock only once per cycle.
+The same parsed prices are handed to ``detect_mispricing``.  The topic filter
+is likewise applied once per market in ``run_all_detectors`` rather than
+inside each detector.
+
 Recommendation logic is signal-specific and driven by quantitative thresholds
 so that only genuinely interesting situations get strong buy signals.
 """
@@ -18,20 +26,37 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import re
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Iterator, NamedTuple, Union
 
 import config
 
+try:
+    # orjson parses the small outcome arrays several times faster; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speed-up
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
 # ── Recommendation constants ─────────────────────────────────────────────────
+# Interned to match the config-parsed filter sets.  Set/dict lookups still
+# hash (cached on the str) and test equality; interning only lets the
+# equality step short-circuit on the identity check instead of comparing
+# characters.  Identifier-like literals ("HIGH", "WATCH") already are
+# interned; the ones with spaces or punctuation are not.
 
 class Action:
-    BUY_YES = "BUY YES"
-    BUY_NO  = "BUY NO"
+    BUY_YES = sys.intern("BUY YES")
+    BUY_NO  = sys.intern("BUY NO")
     WATCH   = "WATCH"
     SKIP    = "SKIP"
 
@@ -41,9 +66,9 @@ class Confidence:
     LOW    = "LOW"
 
 class BetSize:
-    LARGE  = "LARGE ($50–100)"
-    MEDIUM = "MEDIUM ($20–50)"
-    SMALL  = "SMALL ($5–10)"
+    LARGE  = sys.intern("LARGE ($50–100)")
+    MEDIUM = sys.intern("MEDIUM ($20–50)")
+    SMALL  = sys.intern("SMALL ($5–10)")
     NONE   = "NONE"
 
 # Emoji badges for the Telegram header line
@@ -60,9 +85,46 @@ CONFIDENCE_EMOJI = {
 }
 
 
+# ── Signal details ───────────────────────────────────────────────────────────
+# Lightweight fixed-shape records instead of a fresh dict per alert.
+
+class OddsShiftDetails(NamedTuple):
+    price_change_24h: float
+    price_change_1w:  float
+    price_change_1m:  float
+    liquidity:        float
+
+class VolumeSpikeDetails(NamedTuple):
+    volume_24h:       float
+    avg_daily:        float
+    spike_ratio:      float
+    price_change_24h: float
+    liquidity:        float
+
+class ClosingSoonDetails(NamedTuple):
+    hours_until_close: float
+    end_date:          str
+    liquidity:         float
+
+class NewMarketDetails(NamedTuple):
+    age_hours: float
+    liquidity: float
+
+class MispricingDetails(NamedTuple):
+    probability_sum: float
+    deviation:       float
+    num_outcomes:    int
+    total_liquidity: float
+
+SignalDetails = Union[
+    OddsShiftDetails, VolumeSpikeDetails, ClosingSoonDetails,
+    NewMarketDetails, MispricingDetails,
+]
+
+
 # ── Alert dataclass ──────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """One opportunity alert, fully enriched with a structured recommendation."""
 
@@ -82,11 +144,21 @@ class Alert:
     action:          str          # BUY YES | BUY NO | WATCH | SKIP
     confidence:      str          # HIGH | MEDIUM | LOW
     bet_size:        str          # LARGE | MEDIUM | SMALL | NONE
-    explanation:     str          # 1-2 plain-English sentences
+    # Builds `explanation`; deferred so alerts that are never shown cost no formatting
+    explain:         Callable[[], str] = field(compare=False, repr=False)
     risk_note:       str = ""     # optional caution
 
-    # Raw signal data for scoring / sorting
-    details:         dict = field(default_factory=dict)
+    # Raw signal data for scoring / sorting (one *Details tuple per signal type)
+    details:         SignalDetails | None = None
+
+    _explanation:    str | None = field(default=None, init=False, compare=False, repr=False)
+
+    @property
+    def explanation(self) -> str:
+        """1-2 plain-English sentences, formatted on first access and cached."""
+        if self._explanation is None:
+            self._explanation = self.explain()
+        return self._explanation
 
     @property
     def market_url(self) -> str:
@@ -94,24 +166,24 @@ class Alert:
         return f"https://polymarket.com/event/{slug}"
 
     @property
-    def unique_key(self) -> str:
-        return f"{self.market_id}:{self.signal_type}"
+    def unique_key(self) -> tuple[str, str]:
+        return (self.market_id, self.signal_type)
 
     @property
     def edge_pct(self) -> float:
         """Estimated edge as a percentage (signal-type specific)."""
         d = self.details
         if self.signal_type == "odds_shift":
-            return abs(d.get("price_change_24h", 0)) * 100
+            return abs(d.price_change_24h) * 100
         if self.signal_type == "volume_spike":
-            return min(d.get("spike_ratio", 1) * 5, 50)   # cap at 50%
+            return min(d.spike_ratio * 5, 50)   # cap at 50%
         if self.signal_type == "closing_soon":
             # Edge = distance from 50¢ (the more extreme, the clearer the bet)
             return abs(self.yes_price - 0.5) * 100
         if self.signal_type == "new_market":
             return 10.0   # early-mover premium is qualitative
         if self.signal_type == "mispricing":
-            return d.get("deviation", 0) * 100
+            return d.deviation * 100
         return 0.0
 
 
@@ -120,17 +192,32 @@ class Alert:
 def _parse_prices(market: dict) -> list[float]:
     raw = market.get("outcomePrices", "[]")
     try:
-        return [float(p) for p in json.loads(raw)]
+        return [float(p) for p in _json_loads(raw)]
     except (json.JSONDecodeError, TypeError, ValueError):
         return []
 
 
-def _parse_outcomes(market: dict) -> list[str]:
-    raw = market.get("outcomes", "[]")
+def _yes_price(market: dict) -> float | None:
+    """YES implied probability (first outcome price), or None if unparseable."""
+    prices = _parse_prices(market)
+    return prices[0] if prices else None
+
+
+@lru_cache(maxsize=8192)
+def _iso_to_ts(value: str) -> float | None:
+    """
+    Parse an ISO-8601 timestamp (``Z`` suffix allowed) to epoch seconds.
+
+    Naive timestamps are taken as UTC.  Returns None if unparseable.  Cached
+    because market end/creation dates repeat across every scan cycle.
+    """
     try:
-        return json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
-        return []
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 
 def _odds_str(yes: float, no: float) -> str:
@@ -145,20 +232,76 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+# All topic keywords folded into one alternation, so matching is a single
+# C-level scan per market instead of a Python loop over keywords.
+_TOPIC_RE: re.Pattern[str] | None = (
+    re.compile("|".join(re.escape(kw) for kw in sorted(config.TOPIC_KEYWORDS_SET)))
+    if config.TOPIC_KEYWORDS_SET else None
+)
+
+
 def _matches_topic_filter(market: dict) -> bool:
-    keywords = [k.strip().lower() for k in config.TOPIC_KEYWORDS.split(",") if k.strip()]
-    if not keywords:
+    if _TOPIC_RE is None:
         return True
     text = (market.get("question", "") + " " + market.get("description", "")).lower()
-    return any(kw in text for kw in keywords)
+    return _TOPIC_RE.search(text) is not None
+
+
+def _active_markets(markets: list[dict]) -> list[dict]:
+    """Markets that are open and tradable on the order book."""
+    return [
+        m for m in markets
+        if m.get("active") and not m.get("closed") and m.get("enableOrderBook")
+    ]
 
 
 def _liquidity(market: dict) -> float:
     return _safe_float(market.get("liquidityClob") or market.get("liquidityNum"))
 
 
+def _make_alert(
+    market: dict,
+    event_slug: str,
+    signal_type: str,
+    yes: float,
+    no: float,
+    action: str,
+    confidence: str,
+    bet: str,
+    explain: Callable[[], str],
+    risk: str,
+    details: SignalDetails,
+) -> Alert:
+    """Build a per-market ``Alert``, taking its identity fields from ``market``."""
+    return Alert(
+        market_id=market.get("id", ""),
+        market_question=market.get("question", "Unknown"),
+        market_slug=market.get("slug", ""),
+        event_slug=event_slug,
+        signal_type=signal_type,
+        yes_price=yes,
+        no_price=no,
+        current_odds=_odds_str(yes, no),
+        action=action,
+        confidence=confidence,
+        bet_size=bet,
+        explain=explain,
+        risk_note=risk,
+        details=details,
+    )
+
+
 # ── Recommendation helpers ───────────────────────────────────────────────────
 
+def _confidence_tier(value: float, high_at: float, medium_at: float) -> str:
+    """Map a signal strength onto HIGH / MEDIUM / LOW confidence."""
+    if value >= high_at:
+        return Confidence.HIGH
+    if value >= medium_at:
+        return Confidence.MEDIUM
+    return Confidence.LOW
+
+
 def _bet_from_confidence_and_edge(confidence: str, edge_pct: float) -> str:
     """Map confidence + edge magnitude to a bet size."""
     if confidence == Confidence.HIGH and edge_pct >= 15:
@@ -180,7 +323,9 @@ def _liquidity_risk_note(liq: float) -> str:
 
 # ── 1. Sudden Odds Shift ─────────────────────────────────────────────────────
 
-def detect_odds_shift(market: dict, event_slug: str = "") -> list[Alert]:
+def detect_odds_shift(
+    market: dict, event_slug: str = "", yes_price: float | None = None,
+) -> list[Alert]:
     """
     Flag markets where the YES price moved ≥ ODDS_SHIFT_THRESHOLD in 24 h.
 
@@ -191,36 +336,27 @@ def detect_odds_shift(market: dict, event_slug: str = "") -> list[Alert]:
         unless price is already near 0 → SKIP (market resolving)
       - Confidence scales with move size; edge = abs(change)
     """
-    if not _matches_topic_filter(market):
-        return []
-
     change = _safe_float(market.get("oneDayPriceChange"))
     abs_change = abs(change)
     if abs_change < config.ODDS_SHIFT_THRESHOLD:
         return []
 
-    prices = _parse_prices(market)
-    if not prices:
+    yes = yes_price if yes_price is not None else _yes_price(market)
+    if yes is None:
+        return []
+
+    # Skip markets that have already resolved (price at extreme)
+    if yes >= 0.99 or yes <= 0.01:
         return []
 
-    yes = prices[0]
+    # Remaining fields are only read for markets that survived every gate.
     no  = 1.0 - yes
     liq = _liquidity(market)
-
     week_change  = _safe_float(market.get("oneWeekPriceChange"))
     month_change = _safe_float(market.get("oneMonthPriceChange"))
 
-    # Skip markets that have already resolved (price at extreme)
-    if yes >= 0.99 or yes <= 0.01:
-        return []
-
     # ── Confidence ────────────────────────────────────────────────────────────
-    if abs_change >= 0.25:
-        confidence = Confidence.HIGH
-    elif abs_change >= 0.15:
-        confidence = Confidence.MEDIUM
-    else:
-        confidence = Confidence.LOW
+    confidence = _confidence_tier(abs_change, 0.25, 0.15)
 
     # ── Action logic ──────────────────────────────────────────────────────────
     # Price moved UP sharply
@@ -228,7 +364,7 @@ def detect_odds_shift(market: dict, event_slug: str = "") -> list[Alert]:
         if yes > 0.70:
             # Already priced in heavily — fade the move
             action = Action.BUY_NO
-            explanation = (
+            explain = lambda: (
                 f"YES jumped {abs_change*100:.0f}¢ in 24h and is now at {yes*100:.0f}¢ — "
                 f"a likely overshoot. The market may be overreacting. "
                 f"Buying NO at {no*100:.0f}¢ bets on a correction back toward fair value."
@@ -236,7 +372,7 @@ def detect_odds_shift(market: dict, event_slug: str = "") -> list[Alert]:
         else:
             # Strong upward momentum, still room to run
             action = Action.BUY_YES
-            explanation = (
+            explain = lambda: (
                 f"YES surged {abs_change*100:.0f}¢ in 24h to {yes*100:.0f}¢, suggesting "
                 f"new information is driving the market. Momentum often continues "
                 f"short-term — buying YES rides that wave before it fully prices in."
@@ -247,7 +383,7 @@ def detect_odds_shift(market: dict, event_slug: str = "") -> list[Alert]:
             # Near zero — likely resolving NO, risky contrarian
             action = Action.WATCH
             confidence = Confidence.LOW
-            explanation = (
+            explain = lambda: (
                 f"YES crashed {abs_change*100:.0f}¢ in 24h and is now at just {yes*100:.0f}¢. "
                 f"The market is pricing near-certain NO. Watch for any reversal news "
                 f"before considering a contrarian YES bet."
@@ -255,7 +391,7 @@ def detect_odds_shift(market: dict, event_slug: str = "") -> list[Alert]:
         else:
             # Potential overreaction — contrarian YES
             action = Action.BUY_YES
-            explanation = (
+            explain = lambda: (
                 f"YES dropped {abs_change*100:.0f}¢ in 24h to {yes*100:.0f}¢ — a sharp "
                 f"sell-off that may be an overreaction. If the underlying situation "
                 f"hasn't changed fundamentally, buying YES here could capture the bounce."
@@ -266,38 +402,28 @@ def detect_odds_shift(market: dict, event_slug: str = "") -> list[Alert]:
     risk = _liquidity_risk_note(liq)
 
     # Add extra risk note if weekly trend contradicts daily move
-    if week_change != 0 and (change / abs_change) != (week_change / abs(week_change) if week_change != 0 else 1):
+    if week_change != 0 and math.copysign(1.0, change) != math.copysign(1.0, week_change):
         risk = (risk + " " if risk else "") + (
             f"Note: the 7-day trend ({week_change*100:+.0f}¢) runs opposite to today's move — "
             f"this could be a short-term spike rather than a trend change."
         )
 
-    return [Alert(
-        market_id=market.get("id", ""),
-        market_question=market.get("question", "Unknown"),
-        market_slug=market.get("slug", ""),
-        event_slug=event_slug,
-        signal_type="odds_shift",
-        yes_price=yes,
-        no_price=no,
-        current_odds=_odds_str(yes, no),
-        action=action,
-        confidence=confidence,
-        bet_size=bet,
-        explanation=explanation,
-        risk_note=risk,
-        details={
-            "price_change_24h": change,
-            "price_change_1w":  week_change,
-            "price_change_1m":  month_change,
-            "liquidity":        liq,
-        },
+    return [_make_alert(
+        market, event_slug, "odds_shift", yes, no, action, confidence, bet, explain, risk,
+        OddsShiftDetails(
+            price_change_24h=change,
+            price_change_1w=week_change,
+            price_change_1m=month_change,
+            liquidity=liq,
+        ),
     )]
 
 
 # ── 2. Volume Spike ──────────────────────────────────────────────────────────
 
-def detect_volume_spike(market: dict, event_slug: str = "") -> list[Alert]:
+def detect_volume_spike(
+    market: dict, event_slug: str = "", yes_price: float | None = None,
+) -> list[Alert]:
     """
     Flag markets with 24h volume ≥ VOLUME_SPIKE_MULTIPLIER × 30-day daily avg.
 
@@ -306,9 +432,6 @@ def detect_volume_spike(market: dict, event_slug: str = "") -> list[Alert]:
       - We follow the direction of the recent price change (momentum).
       - Very high spikes (>10×) get HIGH confidence; moderate (3-6×) get LOW.
     """
-    if not _matches_topic_filter(market):
-        return []
-
     vol_24h = _safe_float(market.get("volume24hr"))
     vol_1mo = _safe_float(market.get("volume1mo"))
     if vol_24h < config.MIN_VOLUME_24H or vol_1mo <= 0:
@@ -319,31 +442,25 @@ def detect_volume_spike(market: dict, event_slug: str = "") -> list[Alert]:
     if ratio < config.VOLUME_SPIKE_MULTIPLIER:
         return []
 
-    prices = _parse_prices(market)
-    if not prices:
+    yes = yes_price if yes_price is not None else _yes_price(market)
+    if yes is None:
         return []
 
-    yes = prices[0]
-    no  = 1.0 - yes
-    liq = _liquidity(market)
-    change = _safe_float(market.get("oneDayPriceChange"))
-
     # Skip near-resolved markets
     if yes >= 0.98 or yes <= 0.02:
         return []
 
+    no  = 1.0 - yes
+    liq = _liquidity(market)
+    change = _safe_float(market.get("oneDayPriceChange"))
+
     # ── Confidence ────────────────────────────────────────────────────────────
-    if ratio >= 10:
-        confidence = Confidence.HIGH
-    elif ratio >= 5:
-        confidence = Confidence.MEDIUM
-    else:
-        confidence = Confidence.LOW
+    confidence = _confidence_tier(ratio, 10, 5)
 
     # ── Action: follow the price direction of the spike ───────────────────────
     if change > 0.03:
         action = Action.BUY_YES
-        explanation = (
+        explain = lambda: (
             f"Trading volume is {ratio:.1f}× the normal daily average (${vol_24h:,.0f} "
             f"in 24h) and the price is rising (+{change*100:.0f}¢). Heavy buying "
             f"activity usually signals informed traders acting on new information — "
@@ -351,7 +468,7 @@ def detect_volume_spike(market: dict, event_slug: str = "") -> list[Alert]:
         )
     elif change < -0.03:
         action = Action.BUY_NO
-        explanation = (
+        explain = lambda: (
             f"Trading volume is {ratio:.1f}× the normal daily average (${vol_24h:,.0f} "
             f"in 24h) and the price is falling ({change*100:.0f}¢). Heavy selling "
             f"pressure suggests informed traders are exiting YES — buying NO "
@@ -361,7 +478,7 @@ def detect_volume_spike(market: dict, event_slug: str = "") -> list[Alert]:
         # High volume but flat price — contested market, watch only
         action = Action.WATCH
         confidence = Confidence.LOW
-        explanation = (
+        explain = lambda: (
             f"Unusually high volume ({ratio:.1f}× normal, ${vol_24h:,.0f} in 24h) "
             f"but the price hasn't moved much yet. This suggests a tug-of-war "
             f"between buyers and sellers. Watch for a price breakout in either "
@@ -374,33 +491,26 @@ def detect_volume_spike(market: dict, event_slug: str = "") -> list[Alert]:
     if ratio >= 10 and not risk:
         risk = "Note: extreme volume spikes can sometimes be wash trading or a single large order — verify with external news."
 
-    return [Alert(
-        market_id=market.get("id", ""),
-        market_question=market.get("question", "Unknown"),
-        market_slug=market.get("slug", ""),
-        event_slug=event_slug,
-        signal_type="volume_spike",
-        yes_price=yes,
-        no_price=no,
-        current_odds=_odds_str(yes, no),
-        action=action,
-        confidence=confidence,
-        bet_size=bet,
-        explanation=explanation,
-        risk_note=risk,
-        details={
-            "volume_24h":      vol_24h,
-            "avg_daily":       avg_daily,
-            "spike_ratio":     ratio,
-            "price_change_24h": change,
-            "liquidity":       liq,
-        },
+    return [_make_alert(
+        market, event_slug, "volume_spike", yes, no, action, confidence, bet, explain, risk,
+        VolumeSpikeDetails(
+            volume_24h=vol_24h,
+            avg_daily=avg_daily,
+            spike_ratio=ratio,
+            price_change_24h=change,
+            liquidity=liq,
+        ),
     )]
 
 
 # ── 3. Markets About to Resolve ──────────────────────────────────────────────
 
-def detect_closing_soon(market: dict, event_slug: str = "") -> list[Alert]:
+def detect_closing_soon(
+    market: dict,
+    event_slug: str = "",
+    yes_price: float | None = None,
+    now_ts: float | None = None,
+) -> list[Alert]:
     """
     Flag markets resolving within CLOSING_SOON_HOURS whose odds are not extreme.
 
@@ -410,33 +520,29 @@ def detect_closing_soon(market: dict, event_slug: str = "") -> list[Alert]:
       - YES < 25¢ near expiry → BUY NO (lock in the win)
       - 25–75¢ range → WATCH (still genuinely uncertain)
     """
-    if not _matches_topic_filter(market):
-        return []
-
     end_str = market.get("endDate")
     if not end_str:
         return []
-    try:
-        end_date = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
-    except (ValueError, TypeError):
+    end_ts = _iso_to_ts(end_str)
+    if end_ts is None:
         return []
 
-    now = datetime.now(timezone.utc)
-    hours_left = (end_date - now).total_seconds() / 3600.0
+    if now_ts is None:
+        now_ts = time.time()
+    hours_left = (end_ts - now_ts) / 3600.0
     if hours_left <= 0 or hours_left > config.CLOSING_SOON_HOURS:
         return []
 
-    prices = _parse_prices(market)
-    if not prices:
+    yes = yes_price if yes_price is not None else _yes_price(market)
+    if yes is None:
         return []
 
-    yes = prices[0]
-    no  = 1.0 - yes
-    liq = _liquidity(market)
-
     if not (config.CLOSING_EDGE_MIN <= yes <= config.CLOSING_EDGE_MAX):
         return []
 
+    no  = 1.0 - yes
+    liq = _liquidity(market)
+
     # ── Confidence scales with urgency and clarity of odds ────────────────────
     if hours_left <= 6:
         confidence = Confidence.HIGH
@@ -449,7 +555,7 @@ def detect_closing_soon(market: dict, event_slug: str = "") -> list[Alert]:
     if yes >= 0.75:
         action = Action.BUY_YES
         edge   = (yes - 0.5) * 100
-        explanation = (
+        explain = lambda: (
             f"This market resolves in {hours_left:.1f} hours and YES is already "
             f"at {yes*100:.0f}¢. If you believe the outcome is YES, buying now "
             f"locks in a {(1/yes - 1)*100:.0f}% return with very little time left "
@@ -458,7 +564,7 @@ def detect_closing_soon(market: dict, event_slug: str = "") -> list[Alert]:
     elif yes <= 0.25:
         action = Action.BUY_NO
         edge   = (0.5 - yes) * 100
-        explanation = (
+        explain = lambda: (
             f"This market resolves in {hours_left:.1f} hours and YES is only "
             f"{yes*100:.0f}¢ — the market strongly expects NO. Buying NO at "
             f"{no*100:.0f}¢ offers a {(1/no - 1)*100:.0f}% return if the "
@@ -469,7 +575,7 @@ def detect_closing_soon(market: dict, event_slug: str = "") -> list[Alert]:
         action     = Action.WATCH
         confidence = Confidence.LOW
         edge       = abs(yes - 0.5) * 100
-        explanation = (
+        explain = lambda: (
             f"Market closes in {hours_left:.1f} hours with YES at {yes*100:.0f}¢ — "
             f"genuinely uncertain. Only bet if you have specific knowledge about "
             f"the outcome that the market may not have priced in yet."
@@ -482,31 +588,24 @@ def detect_closing_soon(market: dict, event_slug: str = "") -> list[Alert]:
             "⏰ Resolves in under 3 hours — act quickly or the opportunity will be gone."
         )
 
-    return [Alert(
-        market_id=market.get("id", ""),
-        market_question=market.get("question", "Unknown"),
-        market_slug=market.get("slug", ""),
-        event_slug=event_slug,
-        signal_type="closing_soon",
-        yes_price=yes,
-        no_price=no,
-        current_odds=_odds_str(yes, no),
-        action=action,
-        confidence=confidence,
-        bet_size=bet,
-        explanation=explanation,
-        risk_note=risk,
-        details={
-            "hours_until_close": hours_left,
-            "end_date":          end_str,
-            "liquidity":         liq,
-        },
+    return [_make_alert(
+        market, event_slug, "closing_soon", yes, no, action, confidence, bet, explain, risk,
+        ClosingSoonDetails(
+            hours_until_close=hours_left,
+            end_date=end_str,
+            liquidity=liq,
+        ),
     )]
 
 
 # ── 4. New Markets ───────────────────────────────────────────────────────────
 
-def detect_new_market(market: dict, event_slug: str = "") -> list[Alert]:
+def detect_new_market(
+    market: dict,
+    event_slug: str = "",
+    yes_price: float | None = None,
+    now_ts: float | None = None,
+) -> list[Alert]:
     """
     Flag recently created markets where early participants may get better odds.
 
@@ -516,19 +615,16 @@ def detect_new_market(market: dict, event_slug: str = "") -> list[Alert]:
       - We recommend WATCH unless there's a clear directional signal.
       - Confidence is always LOW-MEDIUM since there's no price history yet.
     """
-    if not _matches_topic_filter(market):
-        return []
-
     created_str = market.get("createdAt")
     if not created_str:
         return []
-    try:
-        created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-    except (ValueError, TypeError):
+    created_ts = _iso_to_ts(created_str)
+    if created_ts is None:
         return []
 
-    now = datetime.now(timezone.utc)
-    age_hours = (now - created).total_seconds() / 3600.0
+    if now_ts is None:
+        now_ts = time.time()
+    age_hours = (now_ts - created_ts) / 3600.0
     if age_hours > config.NEW_MARKET_HOURS:
         return []
 
@@ -536,11 +632,10 @@ def detect_new_market(market: dict, event_slug: str = "") -> list[Alert]:
     if liq < config.NEW_MARKET_MIN_LIQUIDITY:
         return []
 
-    prices = _parse_prices(market)
-    if not prices:
+    yes = yes_price if yes_price is not None else _yes_price(market)
+    if yes is None:
         return []
 
-    yes = prices[0]
     no  = 1.0 - yes
 
     # Skip near-resolved markets (price at extreme)
@@ -551,7 +646,7 @@ def detect_new_market(market: dict, event_slug: str = "") -> list[Alert]:
     if yes <= 0.20:
         action     = Action.BUY_NO
         confidence = Confidence.MEDIUM
-        explanation = (
+        explain = lambda: (
             f"New market ({age_hours:.0f}h old) opened at just {yes*100:.0f}¢ for YES — "
             f"the creator already has a strong NO bias. Early liquidity is thin, "
             f"so odds may not yet reflect all public information. "
@@ -560,7 +655,7 @@ def detect_new_market(market: dict, event_slug: str = "") -> list[Alert]:
     elif yes >= 0.80:
         action     = Action.BUY_YES
         confidence = Confidence.MEDIUM
-        explanation = (
+        explain = lambda: (
             f"New market ({age_hours:.0f}h old) opened at {yes*100:.0f}¢ for YES — "
             f"a strong opening bias toward YES. Early movers often set aggressive "
             f"prices. Buying YES at {yes*100:.0f}¢ follows the initial informed view "
@@ -569,7 +664,7 @@ def detect_new_market(market: dict, event_slug: str = "") -> list[Alert]:
     else:
         action     = Action.WATCH
         confidence = Confidence.LOW
-        explanation = (
+        explain = lambda: (
             f"Brand-new market ({age_hours:.0f}h old) with ${liq:,.0f} in liquidity. "
             f"Odds are near 50/50 ({yes*100:.0f}¢ YES) — the market hasn't formed "
             f"a strong view yet. Research the question and return once you have "
@@ -582,30 +677,22 @@ def detect_new_market(market: dict, event_slug: str = "") -> list[Alert]:
         "New markets have no price history — treat early odds as a rough estimate only."
     )
 
-    return [Alert(
-        market_id=market.get("id", ""),
-        market_question=market.get("question", "Unknown"),
-        market_slug=market.get("slug", ""),
-        event_slug=event_slug,
-        signal_type="new_market",
-        yes_price=yes,
-        no_price=no,
-        current_odds=_odds_str(yes, no),
-        action=action,
-        confidence=confidence,
-        bet_size=bet,
-        explanation=explanation,
-        risk_note=risk,
-        details={
-            "age_hours": age_hours,
-            "liquidity": liq,
-        },
+    return [_make_alert(
+        market, event_slug, "new_market", yes, no, action, confidence, bet, explain, risk,
+        NewMarketDetails(
+            age_hours=age_hours,
+            liquidity=liq,
+        ),
     )]
 
 
 # ── 5. Mispricing ────────────────────────────────────────────────────────────
 
-def detect_mispricing(event: dict) -> list[Alert]:
+def detect_mispricing(
+    event: dict,
+    active_markets: list[dict] | None = None,
+    yes_prices: list[float | None] | None = None,
+) -> list[Alert]:
     """
     In multi-outcome events, flag when implied probabilities deviate from 100%.
 
@@ -615,32 +702,47 @@ def detect_mispricing(event: dict) -> list[Alert]:
       - Sum < 100%: at least one outcome is underpriced → find the most
         underpriced and recommend BUY YES on it.
       - Confidence scales with deviation size.
-    """
-    markets = event.get("markets", [])
-    if len(markets) < 2:
-        return []
 
-    active = [
-        m for m in markets
-        if m.get("active") and not m.get("closed") and m.get("enableOrderBook")
-    ]
+    ``active_markets`` lets the caller pass an already-filtered market list,
+    and ``yes_prices`` the matching already-parsed YES prices (same order).
+    """
+    active = (
+        active_markets if active_markets is not None
+        else _active_markets(event.get("markets", []))
+    )
     if len(active) < 2:
         return []
 
-    total_liq = sum(_liquidity(m) for m in active)
-    if total_liq < config.MISPRICE_MIN_LIQUIDITY:
+    # Sum only far enough to prove the liquidity floor; most events that clear
+    # it are still rejected on deviation below, so the exact total (needed for
+    # the risk note) is finished only once every gate has passed.
+    total_liq = 0.0
+    for summed, m in enumerate(active, 1):
+        total_liq += _liquidity(m)
+        if total_liq >= config.MISPRICE_MIN_LIQUIDITY:
+            break
+    else:
         return []
 
-    yes_data: list[tuple[dict, float]] = []
-    for m in active:
-        p = _parse_prices(m)
-        if p:
-            yes_data.append((m, p[0]))
-
-    if len(yes_data) < 2:
+    # One pass: sum of YES prices plus the most over- and under-priced outcome.
+    num_outcomes = 0
+    prob_sum     = 0.0
+    hi_market, hi_price = None, float("-inf")
+    lo_market, lo_price = None, float("inf")
+    prices = yes_prices if yes_prices is not None else map(_yes_price, active)
+    for m, p in zip(active, prices):
+        if p is None:
+            continue
+        num_outcomes += 1
+        prob_sum += p
+        if p > hi_price:
+            hi_market, hi_price = m, p
+        if p < lo_price:
+            lo_market, lo_price = m, p
+
+    if num_outcomes < 2:
         return []
 
-    prob_sum = sum(p for _, p in yes_data)
     deviation = abs(prob_sum - 1.0)
     if deviation < config.MISPRICE_SUM_DEVIATION:
         return []
@@ -648,23 +750,21 @@ def detect_mispricing(event: dict) -> list[Alert]:
     # Filter out sports prop-bet events where many independent markets are
     # grouped together (e.g. 50+ player prop outcomes). These always sum
     # far above 100% by design and are not true mispricings.
-    if len(yes_data) > 20 or prob_sum > 3.0:
+    if num_outcomes > 20 or prob_sum > 3.0:
         return []
 
+    for m in active[summed:]:
+        total_liq += _liquidity(m)
+
     # ── Confidence ────────────────────────────────────────────────────────────
-    if deviation >= 0.15:
-        confidence = Confidence.HIGH
-    elif deviation >= 0.08:
-        confidence = Confidence.MEDIUM
-    else:
-        confidence = Confidence.LOW
+    confidence = _confidence_tier(deviation, 0.15, 0.08)
 
     event_slug = event.get("slug", "")
 
     # ── Find the single most mis-priced outcome ───────────────────────────────
     if prob_sum > 1.0:
-        # Over-sum: find the outcome with the highest price (most overpriced)
-        worst_market, worst_price = max(yes_data, key=lambda x: x[1])
+        # Over-sum: the outcome with the highest price (most overpriced)
+        worst_market, worst_price = hi_market, hi_price
         action = Action.BUY_NO
         yes = worst_price
         no  = 1.0 - yes
@@ -672,16 +772,16 @@ def detect_mispricing(event: dict) -> list[Alert]:
             worst_market.get("groupItemTitle") or
             worst_market.get("question", "?")[:40]
         )
-        explanation = (
-            f"The {len(yes_data)} outcomes in this event sum to {prob_sum*100:.0f}¢ "
+        explain = lambda: (
+            f"The {num_outcomes} outcomes in this event sum to {prob_sum*100:.0f}¢ "
             f"(should be 100¢) — a {deviation*100:.0f}¢ overpricing. "
             f"The most overpriced outcome is \"{outcome_label}\" at {yes*100:.0f}¢. "
             f"Buying NO on it is a near-arbitrage: if any other outcome wins, you profit."
         )
         mkt = worst_market
     else:
-        # Under-sum: find the outcome with the lowest price (most underpriced)
-        best_market, best_price = min(yes_data, key=lambda x: x[1])
+        # Under-sum: the outcome with the lowest price (most underpriced)
+        best_market, best_price = lo_market, lo_price
         action = Action.BUY_YES
         yes = best_price
         no  = 1.0 - yes
@@ -689,8 +789,8 @@ def detect_mispricing(event: dict) -> list[Alert]:
             best_market.get("groupItemTitle") or
             best_market.get("question", "?")[:40]
         )
-        explanation = (
-            f"The {len(yes_data)} outcomes in this event sum to only {prob_sum*100:.0f}¢ "
+        explain = lambda: (
+            f"The {num_outcomes} outcomes in this event sum to only {prob_sum*100:.0f}¢ "
             f"(should be 100¢) — a {deviation*100:.0f}¢ underpricing. "
             f"The most underpriced outcome is \"{outcome_label}\" at {yes*100:.0f}¢. "
             f"Buying YES gives you exposure at a discount to fair value."
@@ -716,48 +816,65 @@ def detect_mispricing(event: dict) -> list[Alert]:
         action=action,
         confidence=confidence,
         bet_size=bet,
-        explanation=explanation,
+        explain=explain,
         risk_note=risk,
-        details={
-            "probability_sum": prob_sum,
-            "deviation":       deviation,
-            "num_outcomes":    len(yes_data),
-            "total_liquidity": total_liq,
-        },
+        details=MispricingDetails(
+            probability_sum=prob_sum,
+            deviation=deviation,
+            num_outcomes=num_outcomes,
+            total_liquidity=total_liq,
+        ),
     )]
 
 
 # ── Aggregate runner ─────────────────────────────────────────────────────────
 
-def run_all_detectors(events: list[dict]) -> list[Alert]:
-    """Run every detector across all events and markets. Returns deduplicated alerts."""
+def run_all_detectors(events: list[dict]) -> tuple[list[Alert], int]:
+    """
+    Run every detector across all events and markets.
+
+    Returns ``(alerts, total_markets)``: the deduplicated alerts and the number
+    of markets scanned, counted during the same traversal.
+    """
+    total_markets = 0
+    now_ts = time.time()   # one clock read for the whole cycle
+
+    def candidates() -> Iterator[Alert]:
+        nonlocal total_markets
+        for event in events:
+            event_slug = event.get("slug", "")
+
+            markets = event.get("markets", [])
+            total_markets += len(markets)
+            active = _active_markets(markets)
+            # Parse outcomePrices once per market, shared by the mispricing
+            # check and every per-market detector.
+            prices = [_yes_price(m) for m in active]
+
+            yield from detect_mispricing(event, active, prices)
+
+            for market, yes in zip(active, prices):
+                # Off-topic markets never reach a detector.  With no keywords
+                # configured the filter is skipped without even a function call.
+                if _TOPIC_RE is not None and not _matches_topic_filter(market):
+                    continue
+                if yes is None:
+                    continue
+
+                yield from detect_odds_shift(market, event_slug, yes)
+                yield from detect_volume_spike(market, event_slug, yes)
+                yield from detect_closing_soon(market, event_slug, yes, now_ts)
+                yield from detect_new_market(market, event_slug, yes, now_ts)
+
+    # Single dedup pass; unique_key is built once per alert.
     alerts: list[Alert] = []
-    seen:   set[str]    = set()
-
-    for event in events:
-        event_slug = event.get("slug", "")
-
-        for alert in detect_mispricing(event):
-            if alert.unique_key not in seen:
-                seen.add(alert.unique_key)
-                alerts.append(alert)
-
-        for market in event.get("markets", []):
-            if not market.get("active") or market.get("closed"):
-                continue
-            if not market.get("enableOrderBook"):
-                continue
-
-            for detector in (
-                detect_odds_shift,
-                detect_volume_spike,
-                detect_closing_soon,
-                detect_new_market,
-            ):
-                for alert in detector(market, event_slug):
-                    if alert.unique_key not in seen:
-                        seen.add(alert.unique_key)
-                        alerts.append(alert)
+    seen:   set[tuple[str, str]] = set()
+    seen_add, alerts_append = seen.add, alerts.append
+    for alert in candidates():
+        key = alert.unique_key
+        if key not in seen:
+            seen_add(key)
+            alerts_append(alert)
 
     logger.info("Detectors produced %d alerts this cycle.", len(alerts))
-    return alerts
+    return alerts, total_markets
@@ -7,9 +7,17 @@ can work with clean Python objects.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
+import os
+import random
+import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -17,35 +25,318 @@ from urllib3.util.retry import Retry
 
 import config
 
+try:
+    # orjson parses the nested /events pages several times faster than the
+    # stdlib; both raise ValueError subclasses on malformed bodies.
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover - optional speed-up
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
 
+_API_HOSTS = (config.GAMMA_API_BASE, config.CLOB_API_BASE, config.DATA_API_BASE)
+
+
+class _JitteredRetry(Retry):
+    """
+    Retry with "full jitter" back-off: each delay is drawn uniformly from
+    [0, exponential cap], so separate clients hitting the same 429 don't
+    retry in lock-step.  Works on both urllib3 1.26 and 2.x.
+    """
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+
 def _build_session() -> requests.Session:
-    """Return a requests Session with automatic retries and back-off."""
+    """
+    Return a requests Session with automatic retries and back-off.
+
+    The session lives for the whole process, so keep-alive connections (and
+    their TLS handshakes) are reused across scan cycles.  Each host's pool is
+    sized to cover the concurrent fetches issued through ``_fetch_executor``.
+    """
     session = requests.Session()
-    retries = Retry(
+    # Only idempotent GETs are retried; a server's Retry-After takes
+    # precedence over the jittered back-off.
+    retries = _JitteredRetry(
         total=config.MAX_RETRIES,
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET", "POST"],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+    )
+    # pool_connections is the number of per-host pools kept (one each for the
+    # Gamma, CLOB and Data APIs); pool_maxsize is the sockets kept per host,
+    # which must cover the fetch executor's concurrency.
+    adapter = HTTPAdapter(
+        max_retries=retries,
+        pool_connections=len(_API_HOSTS),
+        pool_maxsize=config.HTTP_POOL_SIZE,
     )
-    adapter = HTTPAdapter(max_retries=retries)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent":      "polymarket-bot/1.0",
+    })
     return session
 
 
+class _TokenBucket:
+    """
+    Thread-safe token bucket whose refill rate adapts AIMD-style: it grows by
+    ``step`` req/s after each unthrottled response and halves on a 429/503,
+    so the client settles just under whatever rate the server tolerates.
+    """
+
+    def __init__(self, rate: float, max_rate: float, capacity: float, step: float = 0.5) -> None:
+        self.rate     = rate
+        self.min_rate = min(rate, 0.5)
+        self.max_rate = max_rate
+        self.capacity = capacity
+        self.step     = step
+        self._tokens  = capacity
+        self._stamp   = time.monotonic()
+        self._lock    = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block the calling worker thread until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.step)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+
+
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+
+# Shared for the lifetime of the process — do not rebuild per request/cycle.
 _session = _build_session()
+_buckets = {
+    host: _TokenBucket(config.RATE_LIMIT_RPS, config.RATE_LIMIT_MAX_RPS, config.HTTP_POOL_SIZE)
+    for host in _API_HOSTS
+}
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=config.HTTP_POOL_SIZE, thread_name_prefix="polymarket-fetch",
+)
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _ttl_cache(ttl: float, maxsize: int = 256) -> Callable[[_F], _F]:
+    """
+    Memoise a fetcher's result per positional arguments for ``ttl`` seconds.
+
+    Only truthy results are stored, so a failed request (None / []) is
+    retried on the next call rather than cached.  Entries are kept in expiry
+    order: expired ones are dropped on every insert and the oldest are
+    evicted beyond ``maxsize``, so one-off keys can't accumulate.
+
+    Cached results are shared between callers — treat them as read-only.
+    """
+    def decorator(fn: _F) -> _F:
+        cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+            if hit is not None and now < hit[0]:
+                return hit[1]
+            result = fn(*args)
+            with lock:
+                cache.pop(args, None)
+                if result:
+                    cache[args] = (now + ttl, result)
+                while cache and (
+                    len(cache) > maxsize or next(iter(cache.values()))[0] <= now
+                ):
+                    cache.popitem(last=False)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def _get(url: str, **kwargs: Any) -> requests.Response:
+    """
+    ``_session.get`` behind the target host's token bucket.
+
+    Throttling is detected both on the final status and in urllib3's retry
+    history, since a 429 that was retried away still means "slow down".
+    """
+    bucket = next((b for host, b in _buckets.items() if url.startswith(host)), None)
+    if bucket is not None:
+        bucket.acquire()
+    try:
+        resp = _session.get(url, timeout=config.REQUEST_TIMEOUT, **kwargs)
+    except requests.exceptions.RetryError:
+        if bucket is not None:
+            bucket.on_throttle()
+        raise
+
+    if bucket is not None:
+        retries = getattr(resp.raw, "retries", None)
+        throttled = resp.status_code in _THROTTLE_STATUSES or (
+            retries is not None
+            and any(h.status in _THROTTLE_STATUSES for h in retries.history)
+        )
+        if throttled:
+            bucket.on_throttle()
+        else:
+            bucket.on_success()
+    return resp
 
 
 # ── Gamma API helpers ────────────────────────────────────────────────────────
 
-def fetch_active_events(max_events: int | None = None) -> list[dict[str, Any]]:
+# Fixed query parameters of the paginated /events and /markets listings.
+_LISTING_PARAMS = {
+    "active":    "true",
+    "closed":    "false",
+    "order":     "volume24hr",
+    "ascending": "false",
+}
+
+# (path, limit, offset) → (ETag, parsed page) from the last 200 response,
+# for conditional GETs.  Mirrored to config.HTTP_CACHE_FILE when set.
+_etag_cache: dict[tuple[str, int, int], tuple[str, list[dict[str, Any]]]] = {}
+_etag_cache_dirty = False
+
+
+def _load_etag_cache(path: str) -> None:
+    try:
+        with open(path, "rb") as fh:
+            entries = _json_loads(fh.read())
+        for page_path, limit, offset, etag, page in entries:
+            _etag_cache[(page_path, limit, offset)] = (etag, page)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, TypeError) as exc:
+        logger.warning("Ignoring unreadable HTTP cache file %s: %s", path, exc)
+
+
+def _save_etag_cache(path: str) -> None:
+    """Write the ETag cache atomically (temp file + rename)."""
+    entries = [
+        [page_path, limit, offset, etag, page]
+        for (page_path, limit, offset), (etag, page) in _etag_cache.items()
+    ]
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb") as fh:
+            fh.write(_json_dumps(entries))
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Could not write HTTP cache file %s: %s", path, exc)
+
+
+if config.HTTP_CACHE_FILE:
+    _load_etag_cache(config.HTTP_CACHE_FILE)
+
+
+def _fetch_gamma_page(path: str, offset: int, limit: int) -> list[dict[str, Any]] | None:
+    """
+    Fetch one page of active ``/events`` or ``/markets``; returns None if the
+    request failed.
+
+    Revalidates with ``If-None-Match`` when an ETag is known, so an unchanged
+    page costs a 304 with no body and no JSON parsing.
+    """
+    global _etag_cache_dirty
+    key = (path, limit, offset)
+    cached = _etag_cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    try:
+        resp = _get(
+            f"{config.GAMMA_API_BASE}/{path}",
+            params={**_LISTING_PARAMS, "limit": limit, "offset": offset},
+            headers=headers,
+        )
+        if resp.status_code == 304 and cached:
+            return cached[1]
+        resp.raise_for_status()
+        page = _json_loads(resp.content)
+    except (requests.RequestException, ValueError) as exc:
+        logger.error("Gamma API /%s request failed (offset=%d): %s", path, offset, exc)
+        return None
+
+    etag = resp.headers.get("ETag")
+    if etag:
+        _etag_cache[key] = (etag, page)
+        _etag_cache_dirty = True
+    elif _etag_cache.pop(key, None) is not None:
+        _etag_cache_dirty = True
+    return page
+
+
+async def _fetch_gamma_pages(path: str, max_items: int) -> list[dict[str, Any]]:
+    """
+    Fetch up to ``max_items`` rows of a paginated Gamma endpoint.
+
+    All pages are requested concurrently (worker threads from
+    ``_fetch_executor`` sharing the pooled ``_session``), so the fetch costs
+    roughly one round-trip instead of one per page.  The executor is not the
+    loop's default one, so ``asyncio.run`` never blocks on stragglers after a
+    caller's deadline has expired.
+    """
+    global _etag_cache_dirty
+    pages_spec = [
+        (offset, min(config.PAGE_SIZE, max_items - offset))
+        for offset in range(0, max_items, config.PAGE_SIZE)
+    ]
+    loop = asyncio.get_running_loop()
+    pages = await asyncio.gather(*(
+        loop.run_in_executor(_fetch_executor, _fetch_gamma_page, path, offset, limit)
+        for offset, limit in pages_spec
+    ))
+
+    if _etag_cache_dirty and config.HTTP_CACHE_FILE:
+        _save_etag_cache(config.HTTP_CACHE_FILE)
+        _etag_cache_dirty = False
+
+    items: list[dict[str, Any]] = []
+    for (_, limit), page in zip(pages_spec, pages):
+        if not page:
+            break  # failed request or no more results — don't leave a gap
+
+        items.extend(page)
+
+        # If we got fewer results than requested, we've exhausted the data.
+        if len(page) < limit:
+            break
+    return items
+
+
+async def fetch_active_events(max_events: int | None = None) -> list[dict[str, Any]]:
     """
     Fetch all active, non-closed events from the Gamma API.
 
     Each event object includes its nested ``markets`` array.  Results are
     ordered by 24-hour volume descending so the most active events come first.
+    Pages are fetched concurrently (see ``_fetch_gamma_pages``).
 
     Parameters
     ----------
@@ -61,103 +352,53 @@ def fetch_active_events(max_events: int | None = None) -> list[dict[str, Any]]:
     if max_events is None:
         max_events = config.MAX_EVENTS_PER_CYCLE
 
-    events: list[dict[str, Any]] = []
-    offset = 0
-
-    while len(events) < max_events:
-        limit = min(config.PAGE_SIZE, max_events - len(events))
-        url = (
-            f"{config.GAMMA_API_BASE}/events"
-            f"?active=true&closed=false"
-            f"&order=volume24hr&ascending=false"
-            f"&limit={limit}&offset={offset}"
-        )
-        try:
-            resp = _session.get(url, timeout=config.REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            page = resp.json()
-        except requests.RequestException as exc:
-            logger.error("Gamma API /events request failed (offset=%d): %s", offset, exc)
-            break
-
-        if not page:
-            break  # no more results
-
-        events.extend(page)
-        offset += limit
-
-        # If we got fewer results than requested, we've exhausted the data.
-        if len(page) < limit:
-            break
-
-        # Polite pause between pages to avoid hammering the API.
-        time.sleep(0.25)
-
+    events = await _fetch_gamma_pages("events", max_events)
     logger.info("Fetched %d active events from Gamma API.", len(events))
     return events
 
 
-def fetch_active_markets(max_markets: int = 500) -> list[dict[str, Any]]:
+async def fetch_active_markets(max_markets: int = 500) -> list[dict[str, Any]]:
     """
     Fetch active markets directly from the /markets endpoint.
 
     Useful as a fallback or for flat iteration when event grouping is not
-    needed.
-    """
-    markets: list[dict[str, Any]] = []
-    offset = 0
-
-    while len(markets) < max_markets:
-        limit = min(config.PAGE_SIZE, max_markets - len(markets))
-        url = (
-            f"{config.GAMMA_API_BASE}/markets"
-            f"?active=true&closed=false"
-            f"&order=volume24hr&ascending=false"
-            f"&limit={limit}&offset={offset}"
-        )
-        try:
-            resp = _session.get(url, timeout=config.REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            page = resp.json()
-        except requests.RequestException as exc:
-            logger.error("Gamma API /markets request failed (offset=%d): %s", offset, exc)
-            break
-
-        if not page:
-            break
-
-        markets.extend(page)
-        offset += limit
-
-        if len(page) < limit:
-            break
-
-        time.sleep(0.25)
-
+    needed.  Pages are fetched concurrently, like ``fetch_active_events``.
+    """
+    markets = await _fetch_gamma_pages("markets", max_markets)
     logger.info("Fetched %d active markets from Gamma API.", len(markets))
     return markets
 
 
+@_ttl_cache(300)
 def fetch_market_by_slug(slug: str) -> dict[str, Any] | None:
-    """Fetch a single market by its slug identifier."""
+    """
+    Fetch a single market by its slug identifier (cached for 5 minutes).
+
+    The returned dict is shared with later callers; don't mutate it.
+    """
     url = f"{config.GAMMA_API_BASE}/markets/slug/{slug}"
     try:
-        resp = _session.get(url, timeout=config.REQUEST_TIMEOUT)
+        resp = _get(url)
         resp.raise_for_status()
-        return resp.json()
-    except requests.RequestException as exc:
+        return _json_loads(resp.content)
+    except (requests.RequestException, ValueError) as exc:
         logger.error("Failed to fetch market slug=%s: %s", slug, exc)
         return None
 
 
+@_ttl_cache(3600)
 def fetch_tags() -> list[dict[str, Any]]:
-    """Return the list of available market tags/categories."""
+    """
+    Return the list of available market tags/categories (cached for an hour).
+
+    The returned list is shared with later callers; don't mutate it.
+    """
     url = f"{config.GAMMA_API_BASE}/tags"
     try:
-        resp = _session.get(url, timeout=config.REQUEST_TIMEOUT)
+        resp = _get(url)
         resp.raise_for_status()
-        return resp.json()
-    except requests.RequestException as exc:
+        return _json_loads(resp.content)
+    except (requests.RequestException, ValueError) as exc:
         logger.error("Failed to fetch tags: %s", exc)
         return []
 
@@ -166,11 +407,10 @@ def fetch_tags() -> list[dict[str, Any]]:
 
 def fetch_midpoint(token_id: str) -> float | None:
     """Get the midpoint price for a CLOB token."""
-    url = f"{config.CLOB_API_BASE}/midpoint?token_id={token_id}"
     try:
-        resp = _session.get(url, timeout=config.REQUEST_TIMEOUT)
+        resp = _get(f"{config.CLOB_API_BASE}/midpoint", params={"token_id": token_id})
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
         return float(data.get("mid", 0))
     except (requests.RequestException, ValueError, TypeError) as exc:
         logger.debug("Midpoint fetch failed for token %s: %s", token_id[:20], exc)
@@ -179,23 +419,50 @@ def fetch_midpoint(token_id: str) -> float | None:
 
 def fetch_spread(token_id: str) -> dict[str, Any] | None:
     """Get the bid-ask spread for a CLOB token."""
-    url = f"{config.CLOB_API_BASE}/spread?token_id={token_id}"
     try:
-        resp = _session.get(url, timeout=config.REQUEST_TIMEOUT)
+        resp = _get(f"{config.CLOB_API_BASE}/spread", params={"token_id": token_id})
         resp.raise_for_status()
-        return resp.json()
-    except requests.RequestException as exc:
+        return _json_loads(resp.content)
+    except (requests.RequestException, ValueError) as exc:
         logger.debug("Spread fetch failed for token %s: %s", token_id[:20], exc)
         return None
 
 
 def fetch_orderbook(token_id: str) -> dict[str, Any] | None:
     """Get the full order book for a CLOB token."""
-    url = f"{config.CLOB_API_BASE}/book?token_id={token_id}"
     try:
-        resp = _session.get(url, timeout=config.REQUEST_TIMEOUT)
+        resp = _get(f"{config.CLOB_API_BASE}/book", params={"token_id": token_id})
         resp.raise_for_status()
-        return resp.json()
-    except requests.RequestException as exc:
+        return _json_loads(resp.content)
+    except (requests.RequestException, ValueError) as exc:
         logger.debug("Order book fetch failed for token %s: %s", token_id[:20], exc)
         return None
+
+
+async def fetch_clob_bulk(token_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """
+    Fetch midpoint, spread and order book for many CLOB tokens at once.
+
+    Every request runs concurrently on ``_fetch_executor``, whose worker count
+    (``config.HTTP_POOL_SIZE``) bounds the fan-out to the session's
+    connection pool.  Failed lookups come back as None, exactly as from the
+    single-token helpers.
+
+    Returns
+    -------
+    dict
+        ``{token_id: {"mid": float | None, "spread": dict | None, "book": dict | None}}``
+    """
+    loop = asyncio.get_running_loop()
+    fetchers = (("mid", fetch_midpoint), ("spread", fetch_spread), ("book", fetch_orderbook))
+    results = await asyncio.gather(*(
+        loop.run_in_executor(_fetch_executor, fn, tid)
+        for tid in token_ids
+        for _, fn in fetchers
+    ))
+
+    bulk: dict[str, dict[str, Any]] = {}
+    it = iter(results)
+    for tid in token_ids:
+        bulk[tid] = {key: next(it) for key, _ in fetchers}
+    return bulk
@@ -8,19 +8,25 @@ Usage:
 """
 
 import asyncio
+import heapq
 import logging
-import time
+from collections import Counter
+from operator import attrgetter
+from typing import Any, Callable
 
 from dotenv import load_dotenv
 load_dotenv()
 
-import telegram
-from telegram.constants import ParseMode
-
 import config
 from polymarket_client import fetch_active_events
 from detectors import Alert, run_all_detectors
-from telegram_alerts import format_alert_html, _passes_quality_filter
+from telegram_alerts import (
+    SIGNAL_LABELS,
+    format_alert_html,
+    _make_bot,
+    _passes_quality_filter,
+    _send_async as send,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,80 +35,87 @@ logging.basicConfig(
 )
 log = logging.getLogger("top_alerts")
 
+# Seconds between message sends, and how many may be in flight at once.
+SEND_SPACING     = 0.8
+SEND_CONCURRENCY = 4
+
 SIGNAL_ORDER = ["odds_shift", "volume_spike", "closing_soon", "new_market", "mispricing"]
 
-SIGNAL_LABELS = {
-    "odds_shift":   "📊 Sudden Odds Shift",
-    "volume_spike": "📈 Volume Spike",
-    "closing_soon": "⏰ Closing Soon",
-    "new_market":   "🆕 New Market",
-    "mispricing":   "⚖️ Potential Mispricing",
+
+# Per-signal score over the alert's details tuple; a dict dispatch instead of
+# an if-chain of string comparisons on every call.
+_SCORERS: dict[str, Callable[[Any], float]] = {
+    "odds_shift":   lambda d: abs(d.price_change_24h),
+    "volume_spike": attrgetter("spike_ratio"),
+    "closing_soon": lambda d: 1000 / max(d.hours_until_close, 0.1),
+    "new_market":   attrgetter("liquidity"),
+    "mispricing":   attrgetter("deviation"),
 }
 
 
 def score_alert(alert: Alert) -> float:
-    d = alert.details
-    if alert.signal_type == "odds_shift":
-        return abs(d.get("price_change_24h", 0))
-    if alert.signal_type == "volume_spike":
-        return d.get("spike_ratio", 0)
-    if alert.signal_type == "closing_soon":
-        hours = d.get("hours_until_close", 9999)
-        return 1000 / max(hours, 0.1)
-    if alert.signal_type == "new_market":
-        return d.get("liquidity", 0)
-    if alert.signal_type == "mispricing":
-        return d.get("deviation", 0)
-    return 0.0
+    scorer = _SCORERS.get(alert.signal_type)
+    return scorer(alert.details) if scorer is not None else 0.0
+
+
+def select_top_alerts(
+    all_alerts: list[Alert],
+    per_type: int = 2,
+    accept: Callable[[Alert], bool] | None = None,
+) -> tuple[list[Alert], int]:
+    """
+    Select the best `per_type` alerts per signal type, interleaved, keeping
+    only alerts for which `accept` (if given) is true.
+
+    Filtering, scoring and selection happen in one pass over `all_alerts`:
+    each type keeps a min-heap capped at `per_type`, so memory stays
+    O(per_type × types).  Returns ``(selected, accepted_count)``.
+    """
+    heaps: dict[str, list[tuple[float, int, Alert]]] = {s: [] for s in SIGNAL_ORDER}
+    accepted = 0
+    for seq, a in enumerate(all_alerts):
+        if accept is not None and not accept(a):
+            continue
+        accepted += 1
+        heap = heaps.get(a.signal_type)
+        if heap is None:
+            continue
+        # -seq breaks score ties in favour of the earlier alert (and keeps
+        # tuple comparison from ever reaching the Alert itself).
+        entry = (_SCORERS[a.signal_type](a.details), -seq, a)
+        if len(heap) < per_type:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heappushpop(heap, entry)
+
+    top_by_type = {sig: sorted(heap, reverse=True) for sig, heap in heaps.items()}
+    selected: list[Alert] = []
+    for i in range(per_type):
+        for sig in SIGNAL_ORDER:
+            if i < len(top_by_type[sig]):
+                selected.append(top_by_type[sig][i][2])
+    return selected, accepted
 
 
 def pick_top_alerts(all_alerts: list[Alert], per_type: int = 2) -> list[Alert]:
     """Select the best `per_type` alerts per signal type, interleaved."""
-    by_type: dict[str, list[Alert]] = {s: [] for s in SIGNAL_ORDER}
-    for a in all_alerts:
-        if a.signal_type in by_type:
-            by_type[a.signal_type].append(a)
-    for sig in by_type:
-        by_type[sig].sort(key=score_alert, reverse=True)
-    selected: list[Alert] = []
-    for i in range(per_type):
-        for sig in SIGNAL_ORDER:
-            if i < len(by_type[sig]):
-                selected.append(by_type[sig][i])
-    return selected
-
-
-async def send(bot: telegram.Bot, text: str) -> bool:
-    try:
-        await bot.send_message(
-            chat_id=config.TELEGRAM_CHAT_ID,
-            text=text,
-            parse_mode=ParseMode.HTML,
-            disable_web_page_preview=True,
-        )
-        return True
-    except telegram.error.TelegramError as exc:
-        log.error("Send failed: %s", exc)
-        return False
+    return select_top_alerts(all_alerts, per_type)[0]
 
 
 async def main():
-    bot = telegram.Bot(token=config.TELEGRAM_BOT_TOKEN)
+    bot = _make_bot(SEND_CONCURRENCY)
 
     log.info("Fetching active events from Polymarket …")
-    events = fetch_active_events()
-    total_markets = sum(len(e.get("markets", [])) for e in events)
-    log.info("Fetched %d events / %d markets. Running detectors …",
-             len(events), total_markets)
-
-    all_alerts = run_all_detectors(events)
-    log.info("Total raw alerts: %d", len(all_alerts))
+    events = await fetch_active_events()
+    log.info("Fetched %d events. Running detectors …", len(events))
 
-    # Apply quality filter: HIGH confidence + BUY YES/NO only
-    qualified = [a for a in all_alerts if _passes_quality_filter(a)]
-    log.info("After quality filter (HIGH + BUY): %d alerts remain.", len(qualified))
+    all_alerts, total_markets = run_all_detectors(events)
+    log.info("Scanned %d markets. Total raw alerts: %d", total_markets, len(all_alerts))
 
-    top = pick_top_alerts(qualified, per_type=2)
+    # Apply quality filter (HIGH confidence + BUY YES/NO only) and pick the top
+    # alerts per type in the same pass.
+    top, n_qualified = select_top_alerts(all_alerts, per_type=2, accept=_passes_quality_filter)
+    log.info("After quality filter (HIGH + BUY): %d alerts remain.", n_qualified)
     log.info("Selected top %d alerts to send.", len(top))
 
     if not top:
@@ -115,9 +128,7 @@ async def main():
         return
 
     # Count by type for intro
-    type_counts: dict[str, int] = {}
-    for a in top:
-        type_counts[a.signal_type] = type_counts.get(a.signal_type, 0) + 1
+    type_counts = Counter(a.signal_type for a in top)
 
     summary = "\n".join(
         f"  • {SIGNAL_LABELS[s]}: {c} alert{'s' if c > 1 else ''}"
@@ -128,25 +139,35 @@ async def main():
         "<b>🤖 Polymarket Alert Bot — Live Scan Results</b>\n\n"
         f"Scanned <b>{len(events):,}</b> events · <b>{total_markets:,}</b> markets\n"
         f"Total raw signals: <b>{len(all_alerts):,}</b>\n"
-        f"After quality filter (HIGH + BUY only): <b>{len(qualified):,}</b>\n\n"
+        f"After quality filter (HIGH + BUY only): <b>{n_qualified:,}</b>\n\n"
         f"<b>Sending top {len(top)} highest-quality signals:</b>\n{summary}\n\n"
         "<i>Only HIGH confidence BUY YES / BUY NO alerts shown.</i>"
     )
     await send(bot, intro)
     log.info("Sent intro message.")
-    time.sleep(0.8)
+
+    # Sends are started SEND_SPACING apart (keeps order and Telegram's
+    # per-chat pace) but not serialised behind each other's round-trips.
+    sem = asyncio.Semaphore(SEND_CONCURRENCY)
+
+    async def send_alert(alert: Alert, delay: float) -> bool:
+        await asyncio.sleep(delay)
+        async with sem:
+            return await send(bot, format_alert_html(alert))
+
+    results = await asyncio.gather(*(
+        send_alert(alert, i * SEND_SPACING) for i, alert in enumerate(top, 1)
+    ))
 
     sent = 0
-    for i, alert in enumerate(top, 1):
-        html = format_alert_html(alert)
-        ok   = await send(bot, html)
+    for i, (alert, ok) in enumerate(zip(top, results), 1):
         if ok:
             sent += 1
             log.info("  [%d/%d] ✓ [%s] %s | %s | %s",
                      i, len(top), alert.signal_type,
                      alert.action, alert.confidence,
                      alert.market_question[:55])
-        time.sleep(0.8)
+    await asyncio.sleep(SEND_SPACING)
 
     closing = (
         f"<b>✅ Done — {sent}/{len(top)} alerts delivered.</b>\n\n"
@@ -32,44 +32,131 @@ Message format:
 from __future__ import annotations
 
 import asyncio
+import atexit
+import concurrent.futures
+import heapq
+import json
 import logging
+import os
+import random
+import sys
+import threading
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import telegram
 from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 
 import config
-from detectors import Alert, ACTION_EMOJI, CONFIDENCE_EMOJI
+from detectors import Alert, Action, BetSize, Confidence, ACTION_EMOJI, CONFIDENCE_EMOJI
+
+try:
+    # The state file is rewritten after every batch; orjson encodes straight
+    # to bytes several times faster than the stdlib.
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover - optional speed-up
+    from json import loads as _json_loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    # libuv-based loop for the sender thread: cheaper socket I/O per send.
+    from uvloop import new_event_loop as _new_event_loop
+except ImportError:  # pragma: no cover - optional speed-up (no Windows build)
+    from asyncio import new_event_loop as _new_event_loop
 
 logger = logging.getLogger(__name__)
 
 # ── Confidence ordering ───────────────────────────────────────────────────────
 _CONFIDENCE_RANK = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}
+_CONFIDENCE_BONUS = {"HIGH": 20, "MEDIUM": 10, "LOW": 0}   # rank-score points
+
+# Messages from one send_alerts() burst that may be in flight at once.
+_SEND_CONCURRENCY = 5
+
+# Attempts per message, and the base delay (seconds) for retrying network
+# errors: attempt n waits up to _SEND_BACKOFF * 2**n.
+_SEND_ATTEMPTS = 3
+_SEND_BACKOFF  = 1.0
 
 # ── Per-run state (persists across scan cycles within the same process) ───────
-_cooldowns:       dict[str, float] = {}   # unique_key → last sent timestamp
+_cooldowns:       dict[tuple[str, str], float] = {}   # unique_key → last sent timestamp
+_cooldown_expiry: list[tuple[float, tuple[str, str]]] = []   # min-heap of (purge-after, unique_key)
 _daily_sent:      int  = 0                # alerts sent today
-_daily_date:      str  = ""               # "YYYY-MM-DD" of current day (UTC)
+_daily_day:       int  = -1               # current UTC day, as days since the epoch
 _quota_notified:  bool = False            # have we sent the "quota reached" msg?
+_confirmed_sent:  int  = 0                # deliveries not yet collected by wait_for_sends()
+# Guards the state above: send results are applied on the sender thread.
+_state_lock = threading.Lock()
+
+
+# ── State persistence ────────────────────────────────────────────────────────
+
+def _load_state(path: str) -> None:
+    global _daily_sent, _daily_day, _quota_notified
+    try:
+        with open(path, "rb") as fh:
+            state = _json_loads(fh.read())
+        _daily_day      = state["daily_day"]
+        _daily_sent     = state["daily_sent"]
+        _quota_notified = state["quota_notified"]
+        for market_id, signal_type, ts in state["cooldowns"]:
+            _cooldowns[(market_id, signal_type)] = ts
+        _cooldown_expiry[:] = [
+            (ts + config.ALERT_COOLDOWN_SECONDS * 2, key) for key, ts in _cooldowns.items()
+        ]
+        heapq.heapify(_cooldown_expiry)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, TypeError, KeyError) as exc:
+        logger.warning("Ignoring unreadable alert state file %s: %s", path, exc)
+
+
+def _save_state(path: str) -> None:
+    """Write the daily counter and cooldowns atomically (temp file + rename)."""
+    state = {
+        "daily_day":      _daily_day,
+        "daily_sent":     _daily_sent,
+        "quota_notified": _quota_notified,
+        "cooldowns":      [[mid, sig, ts] for (mid, sig), ts in _cooldowns.items()],
+    }
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb") as fh:
+            fh.write(_json_dumps(state))
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Could not write alert state file %s: %s", path, exc)
+
+
+if config.ALERT_STATE_FILE:
+    _load_state(config.ALERT_STATE_FILE)
 
 
 # ── Daily cap helpers ─────────────────────────────────────────────────────────
 
-def _today_utc() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+def _today_utc() -> int:
+    """Current UTC day as a day number: one integer division, no datetime."""
+    return int(time.time()) // 86400
 
 
 def _reset_daily_counter_if_needed() -> None:
     """Reset the daily counter at UTC midnight."""
-    global _daily_sent, _daily_date, _quota_notified
+    global _daily_sent, _daily_day, _quota_notified
     today = _today_utc()
-    if _daily_date != today:
-        if _daily_date:
-            logger.info("New UTC day (%s) — daily alert counter reset.", today)
-        _daily_date     = today
-        _daily_sent     = 0
-        _quota_notified = False
+    if _daily_day != today:
+        with _state_lock:
+            if _daily_day >= 0:
+                logger.info(
+                    "New UTC day (%s) — daily alert counter reset.",
+                    datetime.fromtimestamp(today * 86400, timezone.utc).strftime("%Y-%m-%d"),
+                )
+            _daily_day      = today
+            _daily_sent     = 0
+            _quota_notified = False
 
 
 def daily_slots_remaining() -> int:
@@ -84,16 +171,28 @@ def daily_cap_reached() -> bool:
     return daily_slots_remaining() == 0
 
 
+def get_daily_state() -> tuple[bool, int]:
+    """
+    Reset the counter if the UTC day rolled over, then return
+    ``(cap_reached, slots_remaining)`` from a single read of the state.
+    """
+    slots = daily_slots_remaining()
+    return slots == 0, slots
+
+
 # ── Quality filter ────────────────────────────────────────────────────────────
 
 def _passes_quality_filter(alert: Alert) -> bool:
-    """Return True only if the alert meets MIN_CONFIDENCE and ALLOWED_ACTIONS."""
-    min_rank   = _CONFIDENCE_RANK.get(config.MIN_CONFIDENCE.upper(), 2)
-    alert_rank = _CONFIDENCE_RANK.get(alert.confidence.upper(), 0)
-    if alert_rank < min_rank:
-        return False
-    allowed = {a.strip().upper() for a in config.ALLOWED_ACTIONS.split(",")}
-    return alert.action.upper() in allowed
+    """
+    Return True only if the alert meets MIN_CONFIDENCE and ALLOWED_ACTIONS.
+
+    Both settings are parsed once in config; detectors always emit the
+    upper-case Confidence / Action constants, so no per-alert normalising.
+    """
+    return (
+        _CONFIDENCE_RANK.get(alert.confidence, 0) >= config.MIN_CONFIDENCE_RANK
+        and alert.action in config.ALLOWED_ACTIONS_SET
+    )
 
 
 # ── Ranking ───────────────────────────────────────────────────────────────────
@@ -108,11 +207,11 @@ def _rank_score(alert: Alert) -> float:
       3. Urgency bonus for closing-soon markets (up to +15)
     """
     edge = alert.edge_pct                                         # 0-100+
-    conf_bonus = {"HIGH": 20, "MEDIUM": 10, "LOW": 0}.get(alert.confidence, 0)
+    conf_bonus = _CONFIDENCE_BONUS.get(alert.confidence, 0)
 
     urgency_bonus = 0.0
     if alert.signal_type == "closing_soon":
-        hours = alert.details.get("hours_until_close", 48)
+        hours = alert.details.hours_until_close
         urgency_bonus = max(0, 15 - hours / 3)   # peaks at 15 for <1h remaining
 
     return edge + conf_bonus + urgency_bonus
@@ -125,121 +224,447 @@ def _is_on_cooldown(alert: Alert) -> bool:
 
 
 def _record_sent(alert: Alert) -> None:
-    _cooldowns[alert.unique_key] = time.time()
+    now = time.time()
+    _cooldowns[alert.unique_key] = now
+    heapq.heappush(_cooldown_expiry, (now + config.ALERT_COOLDOWN_SECONDS * 2, alert.unique_key))
 
 
 def _cleanup_cooldowns() -> None:
+    """Drop cooldowns older than twice the cooldown, popping only due heap entries."""
     now = time.time()
-    expired = [k for k, v in _cooldowns.items()
-               if (now - v) > config.ALERT_COOLDOWN_SECONDS * 2]
-    for k in expired:
-        del _cooldowns[k]
+    while _cooldown_expiry and _cooldown_expiry[0][0] < now:
+        _, key = heapq.heappop(_cooldown_expiry)
+        # A key re-sent since this entry was pushed has a later entry of its own.
+        ts = _cooldowns.get(key)
+        if ts is not None and (now - ts) > config.ALERT_COOLDOWN_SECONDS * 2:
+            del _cooldowns[key]
 
 
 # ── Signal type display names ─────────────────────────────────────────────────
-SIGNAL_LABELS = {
+class _Labels(dict):
+    """Display-name table that falls back to the raw key when it has no entry."""
+
+    def __missing__(self, key: str) -> str:
+        return key
+
+
+SIGNAL_LABELS = _Labels({
     "odds_shift":   "📊 Sudden Odds Shift",
     "volume_spike": "📈 Volume Spike",
     "closing_soon": "⏰ Closing Soon",
     "new_market":   "🆕 New Market",
     "mispricing":   "⚖️ Potential Mispricing",
-}
+})
 
 
 # ── HTML helpers ──────────────────────────────────────────────────────────────
 
 def _esc(text: str) -> str:
+    # Most fields hold none of these; three C-level scans beat three replace
+    # calls and hand back the original string untouched.
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
-def _trunc(text: str, max_len: int) -> str:
-    return text if len(text) <= max_len else text[:max_len - 1] + "…"
+# _header_html interpolates these constants unescaped; fail fast if one ever
+# gains an HTML metacharacter.
+assert all(
+    _esc(value) == value
+    for constants in (Action, Confidence, BetSize)
+    for name, value in vars(constants).items() if not name.startswith("_")
+), "detector constants must not need HTML escaping"
+
+
+def _esc_attr(text: str) -> str:
+    """Escape a value for a double-quoted attribute (e.g. an href)."""
+    if '"' not in text:
+        return _esc(text)
+    return _esc(text).replace('"', "&quot;")
+
+
+def _esc_trunc(text: str, max_len: int) -> str:
+    """
+    Truncate, then escape: nothing that is about to be cut off gets escaped,
+    and a cut can never land inside an entity such as ``&amp;``.
+    """
+    return _esc(text if len(text) <= max_len else text[:max_len - 1] + "…")
 
 
 # ── Message formatter ─────────────────────────────────────────────────────────
 
+_RULE = "─" * 32
+
 def format_alert_html(alert: Alert, alert_number: int = 0) -> str:
     """
     Build a rich HTML message for a single Alert.
 
     alert_number: if > 0, shown as "Alert N of MAX today" in the subheader.
     """
-    action_emoji     = ACTION_EMOJI.get(alert.action, "⚪")
-    confidence_emoji = CONFIDENCE_EMOJI.get(alert.confidence, "📌")
-    signal_label     = SIGNAL_LABELS.get(alert.signal_type, alert.signal_type)
+    return _format_alert_html(
+        alert.action, alert.confidence, alert.bet_size, alert.signal_type,
+        alert.market_question, alert.current_odds, alert.edge_pct,
+        alert.explanation, alert.risk_note, alert.market_url, alert_number,
+    )
+
 
-    # ── Header ────────────────────────────────────────────────────────────────
-    header = (
-        f"{action_emoji} <b>{_esc(alert.action)}</b>  |  "
-        f"{confidence_emoji} Confidence: <b>{_esc(alert.confidence)}</b>  |  "
-        f"Bet: <b>{_esc(alert.bet_size)}</b>"
+@lru_cache(maxsize=64)
+def _header_html(action: str, confidence: str, bet_size: str) -> str:
+    """
+    Header line; only a handful of action × confidence × bet combinations
+    exist, so each is built once and shared by every message.  All three
+    values are detectors' Action / Confidence / BetSize constants, which
+    contain no HTML metacharacters, so they are not escaped.
+    """
+    return (
+        f"{ACTION_EMOJI.get(action, '⚪')} <b>{action}</b>  |  "
+        f"{CONFIDENCE_EMOJI.get(confidence, '📌')} Confidence: <b>{confidence}</b>  |  "
+        f"Bet: <b>{bet_size}</b>"
     )
 
+
+@lru_cache(maxsize=1024)
+def _format_alert_html(
+    action: str,
+    confidence: str,
+    bet_size: str,
+    signal_type: str,
+    market_question: str,
+    current_odds: str,
+    edge: float,
+    explanation: str,
+    risk_note: str,
+    market_url: str,
+    alert_number: int,
+) -> str:
+    """
+    Render the message from the alert's displayed fields only.  Keyed on
+    exactly what ends up in the HTML, so an identical alert is never
+    re-escaped and re-joined; the cache holds strings, not Alert objects.
+    """
+    signal_label = SIGNAL_LABELS[signal_type]
+
     # ── Signal type + daily counter ───────────────────────────────────────────
     if alert_number > 0 and config.MAX_ALERTS_PER_DAY > 0:
-        tag = (f"<i>{signal_label}</i>  |  "
-               f"<i>Alert {alert_number} of {config.MAX_ALERTS_PER_DAY} today</i>")
+        counter = f"  |  <i>Alert {alert_number} of {config.MAX_ALERTS_PER_DAY} today</i>"
     else:
-        tag = f"<i>{signal_label}</i>"
+        counter = ""
 
-    # ── Market + odds ─────────────────────────────────────────────────────────
-    market_line = f"📋 <b>Market:</b> {_esc(_trunc(alert.market_question, 120))}"
+    # ── Odds + edge ───────────────────────────────────────────────────────────
+    odds = _esc_trunc(current_odds, 300)
 
-    odds = _esc(alert.current_odds)
-    if len(odds) > 300:
-        odds = odds[:297] + "…"
-    odds_line = f"💰 <b>Odds:</b> {odds}"
+    edge_line = f"\n   <i>Estimated edge: ~{edge:.0f}%</i>" if edge >= 3 else ""
 
-    edge      = alert.edge_pct
-    edge_line = f"   <i>Estimated edge: ~{edge:.0f}%</i>" if edge >= 3 else ""
+    # ── Risk note ─────────────────────────────────────────────────────────────
+    risk_block = f"\n\n⚠️ <b>Risk:</b> {_esc_trunc(risk_note, 300)}" if risk_note else ""
+
+    # Optional sections carry their own leading newlines, so the message is
+    # assembled by one f-string instead of a parts list and a join.
+    return (
+        f"{_header_html(action, confidence, bet_size)}\n"
+        f"<i>{signal_label}</i>{counter}\n"
+        f"{_RULE}\n"
+        f"📋 <b>Market:</b> {_esc_trunc(market_question, 120)}\n"
+        f"💰 <b>Odds:</b> {odds}{edge_line}\n"
+        "\n"
+        f"💡 <b>Why this is an opportunity:</b>\n{_esc_trunc(explanation, 500)}{risk_block}\n"
+        "\n"
+        f'🔗 <a href="{_esc_attr(market_url)}">View on Polymarket</a>'
+    )
 
-    # ── Explanation ───────────────────────────────────────────────────────────
-    reason    = _esc(_trunc(alert.explanation, 500))
-    why_block = f"💡 <b>Why this is an opportunity:</b>\n{reason}"
 
-    # ── Risk note ─────────────────────────────────────────────────────────────
-    risk_block = ""
-    if alert.risk_note:
-        risk_text  = _esc(_trunc(alert.risk_note, 300))
-        risk_block = f"\n⚠️ <b>Risk:</b> {risk_text}"
+# ── Rate limiting ────────────────────────────────────────────────────────────
+
+class _RateLimiter:
+    """
+    Async token bucket: `capacity` sends in a burst, refilled at `rate`/s.
+
+    Tokens are taken up front and may go negative, so concurrent callers
+    queue up behind each other (each sleeps until its own token is due)
+    without needing a lock on the single-threaded event loop.
+    """
 
-    # ── Link ──────────────────────────────────────────────────────────────────
-    link = f'🔗 <a href="{alert.market_url}">View on Polymarket</a>'
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate       = rate
+        self.capacity   = capacity
+        self.tokens     = capacity
+        self.updated_at = time.monotonic()
 
-    parts = [header, tag, "─" * 32, market_line, odds_line]
-    if edge_line:
-        parts.append(edge_line)
-    parts += ["", why_block]
-    if risk_block:
-        parts.append(risk_block)
-    parts += ["", link]
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
 
-    return "\n".join(parts)
+
+# Telegram allows roughly 20 messages/min into one chat and ~30/s per bot.
+_per_chat = _RateLimiter(rate=20 / 60, capacity=20)
+_global   = _RateLimiter(rate=25, capacity=25)
 
 
 # ── Async send helper ─────────────────────────────────────────────────────────
 
+# Built once; the bare disable_web_page_preview flag is the deprecated spelling.
+_NO_LINK_PREVIEW = telegram.LinkPreviewOptions(is_disabled=True)
+
+
 async def _send_async(bot: telegram.Bot, text: str) -> bool:
-    try:
-        await bot.send_message(
-            chat_id=config.TELEGRAM_CHAT_ID,
-            text=text,
-            parse_mode=ParseMode.HTML,
-            disable_web_page_preview=True,
-        )
-        return True
-    except telegram.error.TelegramError as exc:
-        logger.error("Telegram send failed: %s", exc)
-        return False
+    """
+    Send one HTML message, retrying up to _SEND_ATTEMPTS times in total.
+
+    Flood control (RetryAfter) waits exactly as long as Telegram asks;
+    network errors and timeouts back off exponentially with full jitter.
+    Anything else (bad request, forbidden, …) fails immediately.  Every
+    attempt goes through the rate limiters, so retries can't burst.
+    """
+    for attempt in range(_SEND_ATTEMPTS):
+        await _per_chat.acquire()
+        await _global.acquire()
+        try:
+            await bot.send_message(
+                chat_id=config.TELEGRAM_CHAT_ID,
+                text=text,
+                parse_mode=ParseMode.HTML,
+                link_preview_options=_NO_LINK_PREVIEW,
+            )
+            return True
+        except telegram.error.RetryAfter as exc:
+            error, delay = exc, float(exc.retry_after)
+        except telegram.error.BadRequest as exc:   # a NetworkError subclass, but never transient
+            logger.error("Telegram send failed: %s", exc)
+            return False
+        except telegram.error.NetworkError as exc:  # includes TimedOut
+            error, delay = exc, random.uniform(0, _SEND_BACKOFF * 2 ** attempt)
+        except telegram.error.TelegramError as exc:
+            logger.error("Telegram send failed: %s", exc)
+            return False
+
+        if attempt == _SEND_ATTEMPTS - 1:
+            break
+        logger.warning("Telegram send failed (%s) — retrying in %.1fs", error, delay)
+        await asyncio.sleep(delay)
+
+    logger.error("Telegram send failed after %d attempts: %s", _SEND_ATTEMPTS, error)
+    return False
+
+
+# Telegram rejects messages over 4096 characters; leave some headroom.
+_MAX_MESSAGE_CHARS = 4000
+_ALERT_SEPARATOR   = "\n\n" + "═" * 32 + "\n\n"
+
+
+def _coalesce(htmls: list[str]) -> tuple[list[str], list[int]]:
+    """
+    Greedily pack rendered alerts, in order, into as few messages as fit
+    under _MAX_MESSAGE_CHARS.  Returns ``(messages, owner)`` where
+    ``owner[i]`` is the index of the message carrying ``htmls[i]``.
+    """
+    messages: list[str] = []
+    owner:    list[int] = []
+    for html in htmls:
+        if messages and len(messages[-1]) + len(_ALERT_SEPARATOR) + len(html) <= _MAX_MESSAGE_CHARS:
+            messages[-1] += _ALERT_SEPARATOR + html
+        else:
+            messages.append(html)
+        owner.append(len(messages) - 1)
+    return messages, owner
+
+
+def _digest_row(alert: Alert, number: int) -> str:
+    """One compact digest line: action, confidence, signal, linked question, odds."""
+    edge = alert.edge_pct
+    edge_text = f" · edge ~{edge:.0f}%" if edge >= 3 else ""
+    return (
+        f"{number}. {ACTION_EMOJI.get(alert.action, '⚪')} <b>{alert.action}</b> · "
+        f"{CONFIDENCE_EMOJI.get(alert.confidence, '📌')} {alert.confidence} · "
+        f"<i>{SIGNAL_LABELS[alert.signal_type]}</i>\n"
+        f'   <a href="{_esc_attr(alert.market_url)}">{_esc_trunc(alert.market_question, 80)}</a>'
+        f" — {_esc_trunc(alert.current_odds, 60)}{edge_text}"
+    )
+
+
+def _format_digest(alerts: list[Alert], first_number: int) -> tuple[list[str], list[int]]:
+    """
+    Render `alerts` as compact digest rows packed under _MAX_MESSAGE_CHARS.
+    Returns ``(messages, owner)`` like _coalesce().
+    """
+    header = f"<b>📬 Alert digest — {len(alerts)} signals</b>"
+    messages: list[str] = []
+    owner:    list[int] = []
+    for number, alert in enumerate(alerts, first_number):
+        row = _digest_row(alert, number)
+        if messages and len(messages[-1]) + 2 + len(row) <= _MAX_MESSAGE_CHARS:
+            messages[-1] += "\n\n" + row
+        else:
+            messages.append(f"{header if not messages else '<b>📬 Alert digest (cont.)</b>'}\n\n{row}")
+        owner.append(len(messages) - 1)
+    return messages, owner
+
+
+async def _send_batch(bot: telegram.Bot, texts: list[str]) -> list[bool]:
+    """Send several messages concurrently, at most _SEND_CONCURRENCY in flight."""
+    sem = asyncio.Semaphore(_SEND_CONCURRENCY)
+
+    async def send_one(text: str) -> bool:
+        async with sem:
+            return await _send_async(bot, text)
+
+    return await asyncio.gather(*(send_one(t) for t in texts))
+
+
+# One event loop and one Bot for the whole process, so the Bot's HTTP client
+# keeps its keep-alive connections to api.telegram.org between messages.  The
+# loop runs on a background sender thread, so a slow Telegram round-trip never
+# stalls the scan loop.  Both are created lazily: the Bot's connection pool is
+# bound to the loop that first uses it, so they must live and die together.
+_loop:          asyncio.AbstractEventLoop | None = None
+_sender_thread: threading.Thread | None = None
+_bot:           telegram.Bot | None = None
+_loop_lock = threading.Lock()
+_pending: set[concurrent.futures.Future] = set()   # sends not yet finished
+
+# Seconds to wait at exit for queued messages to go out.
+_DRAIN_TIMEOUT = 60
+
+
+def _make_bot(concurrency: int = _SEND_CONCURRENCY) -> telegram.Bot:
+    """
+    A Bot whose connection pool fits `concurrency` sends in flight.
+
+    The library default is a single pooled connection with a 1s pool
+    timeout, which would make concurrent sends time out waiting for it;
+    give every in-flight send its own keep-alive connection.
+    """
+    return telegram.Bot(
+        token=config.TELEGRAM_BOT_TOKEN,
+        request=HTTPXRequest(
+            connection_pool_size=concurrency,
+            pool_timeout=5.0,
+            connect_timeout=5.0,
+            read_timeout=10.0,
+        ),
+    )
+
+
+def _get_bot() -> telegram.Bot:
+    global _bot
+    if _bot is None:
+        _bot = _make_bot()
+    return _bot
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _sender_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = _new_event_loop()
+            _sender_thread = threading.Thread(
+                target=_loop.run_forever, name="telegram-sender", daemon=True,
+            )
+            _sender_thread.start()
+            atexit.register(_close_loop)
+    return _loop
+
+
+def _submit(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the sender thread without waiting for it."""
+    fut = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    _pending.add(fut)
+    fut.add_done_callback(_pending.discard)
+    return fut
 
 
 def _run(coro):
-    """Run a coroutine in a fresh event loop."""
-    loop = asyncio.new_event_loop()
+    """Run a coroutine on the sender thread and wait for its result."""
+    return _submit(coro).result()
+
+
+async def _send_after(earlier: list[concurrent.futures.Future], coro):
+    """Await `coro` once every future in `earlier` has finished."""
+    await asyncio.gather(*map(asyncio.wrap_future, earlier), return_exceptions=True)
+    return await coro
+
+
+def _close_loop() -> None:
+    concurrent.futures.wait(list(_pending), timeout=_DRAIN_TIMEOUT)
+    if _bot is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_bot.shutdown(), _loop).result(timeout=10)
+        except Exception:  # best effort at interpreter exit
+            pass
+    _loop.call_soon_threadsafe(_loop.stop)
+    _sender_thread.join(timeout=10)
+    if not _loop.is_running():
+        _loop.close()
+
+
+async def _deliver_batch(
+    bot: telegram.Bot,
+    messages: list[str],
+    ranked: list[tuple[float, int, Alert]],
+    owner: list[int],
+    first_number: int,
+    day: int,
+) -> None:
+    """
+    Send one queued batch, then settle its bookkeeping before returning, so
+    anyone waiting on the batch sees the final counters.
+    ``owner[i]`` is the index of the message that carried the i-th alert.
+    """
     try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+        sent_ok = await _send_batch(bot, messages)
+    except Exception:
+        logger.exception("Telegram batch send failed")
+        sent_ok = [False] * len(messages)
+    _finish_batch(ranked, [sent_ok[i] for i in owner], first_number, day)
+
+
+def _finish_batch(
+    ranked: list[tuple[float, int, Alert]],
+    results: list[bool],
+    first_number: int,
+    day: int,
+) -> None:
+    """
+    Runs on the sender thread once a batch is done: log what went out, count
+    it as delivered, and hand back the daily slot and cooldown claimed for
+    each failed send.
+    """
+    global _daily_sent, _confirmed_sent
+    log_sent = logger.isEnabledFor(logging.INFO)
+    with _state_lock:
+        for number, ((score, _, alert), ok) in enumerate(zip(ranked, results), first_number):
+            if ok:
+                _confirmed_sent += 1
+                if log_sent:
+                    logger.info(
+                        "  ✓ Sent alert %d/%d today: [%s] %s | score=%.1f",
+                        number, config.MAX_ALERTS_PER_DAY,
+                        alert.signal_type, alert.market_question[:55], score,
+                    )
+                continue
+            _cooldowns.pop(alert.unique_key, None)
+            if _daily_day == day:
+                _daily_sent -= 1
+        if config.ALERT_STATE_FILE:
+            _save_state(config.ALERT_STATE_FILE)
+
+
+def wait_for_sends(timeout: float | None = None) -> int:
+    """
+    Block until every queued batch has finished (or `timeout` passes) and
+    return how many alerts were confirmed delivered since the last call.
+
+    Failed sends have handed their daily slots back by then, so the daily
+    state read afterwards reflects real deliveries, not just queued ones.
+    """
+    global _confirmed_sent
+    concurrent.futures.wait(list(_pending), timeout=timeout)
+    with _state_lock:
+        delivered, _confirmed_sent = _confirmed_sent, 0
+    return delivered
 
 
 # ── Main send function ────────────────────────────────────────────────────────
@@ -253,9 +678,12 @@ def send_alerts(alerts: list[Alert]) -> int:
       2. Apply per-market cooldown.
       3. Rank survivors by composite score (edge + confidence + urgency).
       4. Take only as many as the daily cap allows.
-      5. Send them, recording each one sent.
+      5. Queue them for sending, claiming their slots and cooldowns.
+
+    Steps 1-4 run as a single pass over `alerts`.
 
-    Returns the count of alerts actually sent.
+    Sending happens on the background sender thread; returns the count of
+    alerts queued for it.
     """
     global _daily_sent, _quota_notified
 
@@ -263,37 +691,43 @@ def send_alerts(alerts: list[Alert]) -> int:
 
     if not config.TELEGRAM_BOT_TOKEN or not config.TELEGRAM_CHAT_ID:
         logger.warning("Telegram not configured — printing to console.")
-        qualified = [a for a in alerts if _passes_quality_filter(a)]
-        for a in qualified:
-            _print_console(a)
+        # One write for the whole batch instead of a dozen print() calls per alert.
+        sys.stdout.write("".join(_console_block(a) for a in alerts if _passes_quality_filter(a)))
+        sys.stdout.flush()
         return 0
 
-    # ── Step 1: quality filter ────────────────────────────────────────────────
-    qualified = [a for a in alerts if _passes_quality_filter(a)]
-    skipped_q = len(alerts) - len(qualified)
-
-    # ── Step 2: cooldown filter ───────────────────────────────────────────────
-    fresh = [a for a in qualified if not _is_on_cooldown(a)]
-    skipped_c = len(qualified) - len(fresh)
-
-    # ── Step 3: rank by composite score ──────────────────────────────────────
-    ranked = sorted(fresh, key=_rank_score, reverse=True)
-
-    # ── Step 4: daily cap ─────────────────────────────────────────────────────
+    # ── Steps 1-4: quality, cooldown, rank and cap in one pass ───────────────
+    # A min-heap of at most `slots` entries keeps the best alerts seen so far;
+    # -seq makes ties go to the earlier alert, as a stable sort would.
     slots = daily_slots_remaining()
+    n_qualified = n_fresh = 0
+    best: list[tuple[float, int, Alert]] = []
+    for seq, alert in enumerate(alerts):
+        if not _passes_quality_filter(alert):
+            continue
+        n_qualified += 1
+        if _is_on_cooldown(alert):
+            continue
+        n_fresh += 1
+        entry = (_rank_score(alert), -seq, alert)
+        if len(best) < slots:
+            heapq.heappush(best, entry)
+        elif best and entry > best[0]:
+            heapq.heapreplace(best, entry)
 
     logger.info(
-        "Alert pipeline: %d raw → %d quality → %d fresh → %d ranked | "
+        "Alert pipeline: %d raw → %d quality → %d fresh | "
         "%d daily slot(s) remaining.",
-        len(alerts), len(qualified), len(fresh), len(ranked), slots,
+        len(alerts), n_qualified, n_fresh, slots,
     )
 
     if slots == 0:
         if not _quota_notified:
             _quota_notified = True
             logger.info("Daily cap of %d reached — no more alerts today.", config.MAX_ALERTS_PER_DAY)
-            _run(_send_async(
-                telegram.Bot(token=config.TELEGRAM_BOT_TOKEN),
+            # Queued behind any alerts still in flight, so it arrives last.
+            _submit(_send_after(list(_pending), _send_async(
+                _get_bot(),
                 (
                     f"🛑 <b>Daily alert quota reached</b>\n\n"
                     f"The bot has sent its maximum of <b>{config.MAX_ALERTS_PER_DAY} alerts</b> "
@@ -302,58 +736,62 @@ def send_alerts(alerts: list[Alert]) -> int:
                     f"<i>To increase the daily limit, change <code>MAX_ALERTS_PER_DAY</code> "
                     f"in your Railway environment variables.</i>"
                 ),
-            ))
+            )))
+            if config.ALERT_STATE_FILE:
+                with _state_lock:
+                    _save_state(config.ALERT_STATE_FILE)
         return 0
 
-    to_send = ranked[:slots]
-
-    # ── Step 5: send ──────────────────────────────────────────────────────────
-    bot  = telegram.Bot(token=config.TELEGRAM_BOT_TOKEN)
-    sent = 0
-    for alert in to_send:
-        alert_number = _daily_sent + 1
-        html = format_alert_html(alert, alert_number=alert_number)
-        ok   = _run(_send_async(bot, html))
-        if ok:
+    # Each entry keeps the score it was ranked by, for the log line below.
+    ranked  = sorted(best, reverse=True)
+    to_send = [alert for _, _, alert in ranked]
+
+    # ── Step 5: queue for sending ─────────────────────────────────────────────
+    # Slots and cooldowns are claimed now, so the next cycle already sees them
+    # while these messages are in flight; _deliver_batch gives back any that
+    # fail.  Messages are numbered in rank order.
+    with _state_lock:
+        first_number = _daily_sent + 1
+        for alert in to_send:
             _record_sent(alert)
-            _daily_sent += 1
-            sent += 1
-            logger.info(
-                "  ✓ Sent alert %d/%d today: [%s] %s | score=%.1f",
-                _daily_sent, config.MAX_ALERTS_PER_DAY,
-                alert.signal_type, alert.market_question[:55],
-                _rank_score(alert),
-            )
-            time.sleep(0.5)
+        _daily_sent += len(to_send)
+        _cleanup_cooldowns()
 
-        # Re-check cap after each send (in case another thread incremented it)
-        if daily_cap_reached():
-            break
+    if 0 < config.DIGEST_THRESHOLD < len(to_send):
+        messages, owner = _format_digest(to_send, first_number)
+    else:
+        htmls = [
+            format_alert_html(alert, alert_number=first_number + i)
+            for i, alert in enumerate(to_send)
+        ]
+        if config.COALESCE_ALERTS:
+            messages, owner = _coalesce(htmls)
+        else:
+            messages, owner = htmls, list(range(len(htmls)))
 
-    _cleanup_cooldowns()
-    return sent
+    _submit(_deliver_batch(_get_bot(), messages, ranked, owner, first_number, _daily_day))
+    return len(to_send)
 
 
 # ── Startup / error messages ──────────────────────────────────────────────────
 
-def send_startup_message() -> None:
-    if not config.TELEGRAM_BOT_TOKEN or not config.TELEGRAM_CHAT_ID:
-        logger.info("Telegram not configured — skipping startup message.")
-        return
-
+@lru_cache(maxsize=1)
+def _startup_text() -> str:
+    """The startup banner; depends only on config, so it is built once."""
     cap_text = (
         f"<b>{config.MAX_ALERTS_PER_DAY} alerts/day max</b> "
         f"(resets at UTC midnight)"
         if config.MAX_ALERTS_PER_DAY > 0
         else "No daily cap (unlimited)"
     )
+    topics = _esc(config.TOPIC_KEYWORDS) if config.TOPIC_KEYWORDS else "all markets"
 
-    text = (
+    return (
         "<b>🤖 Polymarket Alert Bot — Online</b>\n\n"
         f"Polling every <b>{config.POLL_INTERVAL_SECONDS}s</b>\n\n"
         "<b>🔍 Active filters:</b>\n"
-        f"  • Minimum confidence: <b>{config.MIN_CONFIDENCE}</b>\n"
-        f"  • Allowed actions: <b>{config.ALLOWED_ACTIONS}</b>\n"
+        f"  • Minimum confidence: <b>{_esc(config.MIN_CONFIDENCE)}</b>\n"
+        f"  • Allowed actions: <b>{_esc(config.ALLOWED_ACTIONS)}</b>\n"
         f"  • Daily alert cap: {cap_text}\n\n"
         "<b>Detection thresholds:</b>\n"
         f"  • Odds shift: {config.ODDS_SHIFT_THRESHOLD*100:.0f}pp in 24h\n"
@@ -361,33 +799,42 @@ def send_startup_message() -> None:
         f"  • Closing soon: within {config.CLOSING_SOON_HOURS}h\n"
         f"  • New markets: created within {config.NEW_MARKET_HOURS}h\n"
         f"  • Mispricing: ≥{config.MISPRICE_SUM_DEVIATION*100:.0f}pp deviation\n\n"
-        f"Topic filter: <i>{'all markets' if not config.TOPIC_KEYWORDS else config.TOPIC_KEYWORDS}</i>\n"
+        f"Topic filter: <i>{topics}</i>\n"
         f"Alert cooldown: {config.ALERT_COOLDOWN_SECONDS // 60} min per market\n\n"
         "<i>Alerts are ranked by edge strength — you'll only receive the best opportunities of the day.</i>"
     )
-    _run(_send_async(telegram.Bot(token=config.TELEGRAM_BOT_TOKEN), text))
+
+
+def send_startup_message() -> None:
+    if not config.TELEGRAM_BOT_TOKEN or not config.TELEGRAM_CHAT_ID:
+        logger.info("Telegram not configured — skipping startup message.")
+        return
+    _run(_send_async(_get_bot(), _startup_text()))
 
 
 def send_error_message(error_text: str) -> None:
     if not config.TELEGRAM_BOT_TOKEN or not config.TELEGRAM_CHAT_ID:
         return
     text = f"<b>⚠️ Polymarket Bot Error</b>\n\n<code>{_esc(error_text[-600:])}</code>"
-    _run(_send_async(telegram.Bot(token=config.TELEGRAM_BOT_TOKEN), text))
+    _run(_send_async(_get_bot(), text))
 
 
 # ── Console fallback ──────────────────────────────────────────────────────────
 
-def _print_console(alert: Alert) -> None:
-    action_emoji = ACTION_EMOJI.get(alert.action, "⚪")
-    print("\n" + "═" * 65)
-    print(f"  {action_emoji} {alert.action}  |  Confidence: {alert.confidence}  |  Bet: {alert.bet_size}")
-    print(f"  Signal: {SIGNAL_LABELS.get(alert.signal_type, alert.signal_type)}")
-    print(f"  Score:  {_rank_score(alert):.1f}")
-    print("  " + "─" * 61)
-    print(f"  Market:  {alert.market_question}")
-    print(f"  Odds:    {alert.current_odds}  (edge ~{alert.edge_pct:.0f}%)")
-    print(f"  Why:     {alert.explanation}")
-    if alert.risk_note:
-        print(f"  Risk:    {alert.risk_note}")
-    print(f"  Link:    {alert.market_url}")
-    print("═" * 65)
+def _console_block(alert: Alert) -> str:
+    """The console rendering of one alert, newline-terminated."""
+    risk_line = f"  Risk:    {alert.risk_note}\n" if alert.risk_note else ""
+    return (
+        f"\n{'═' * 65}\n"
+        f"  {ACTION_EMOJI.get(alert.action, '⚪')} {alert.action}  |  "
+        f"Confidence: {alert.confidence}  |  Bet: {alert.bet_size}\n"
+        f"  Signal: {SIGNAL_LABELS[alert.signal_type]}\n"
+        f"  Score:  {_rank_score(alert):.1f}\n"
+        f"  {'─' * 61}\n"
+        f"  Market:  {alert.market_question}\n"
+        f"  Odds:    {alert.current_odds}  (edge ~{alert.edge_pct:.0f}%)\n"
+        f"  Why:     {alert.explanation}\n"
+        f"{risk_line}"
+        f"  Link:    {alert.market_url}\n"
+        f"{'═' * 65}\n"
+    )